@@ -22,6 +22,7 @@ from homeassistant.core import (
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import dt as dt_util
+from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import auth_store, jwt_wrapper, models
 from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN, REFRESH_TOKEN_EXPIRATION
@@ -32,6 +33,11 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+# Verified access tokens kept to skip signature verification on reuse
+ACCESS_TOKEN_CACHE_SIZE = 256
+# Leeway in seconds when checking the expiration of access tokens
+ACCESS_TOKEN_LEEWAY = 10
+
 _MfaModuleDict = dict[str, MultiFactorAuthModule]
 _ProviderKey = tuple[str, str | None]
 _ProviderDict = dict[_ProviderKey, AuthProvider]
@@ -169,6 +175,10 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, set[CALLBACK_TYPE]] = {}
+        # Access token -> (refresh token, expiration timestamp)
+        self._access_token_cache: LimitedSizeDict[
+            str, tuple[models.RefreshToken, float]
+        ] = LimitedSizeDict(size_limit=ACCESS_TOKEN_CACHE_SIZE)
         self._expire_callback: CALLBACK_TYPE | None = None
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
@@ -337,6 +347,7 @@ class AuthManager:
             await asyncio.gather(*tasks)
 
         await self._store.async_remove_user(user)
+        self._access_token_cache.clear()
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -505,6 +516,9 @@ class AuthManager:
     def async_remove_refresh_token(self, refresh_token: models.RefreshToken) -> None:
         """Delete a refresh token."""
         self._store.async_remove_refresh_token(refresh_token)
+        for token, (cached_refresh_token, _) in list(self._access_token_cache.items()):
+            if cached_refresh_token is refresh_token:
+                del self._access_token_cache[token]
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, ())
         for revoke_callback in callbacks:
@@ -618,7 +632,23 @@ class AuthManager:
 
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
-        """Return refresh token if an access token is valid."""
+        """Return refresh token if an access token is valid.
+
+        Verified tokens are cached until they expire, so repeated requests
+        with the same token skip decoding and signature verification.
+        """
+        if (cached := self._access_token_cache.get(token)) is not None:
+            cached_refresh_token, expire_at = cached
+            user = cached_refresh_token.user
+            if (
+                time.time() < expire_at
+                and user.is_active
+                and user.refresh_tokens.get(cached_refresh_token.id)
+                is cached_refresh_token
+            ):
+                return cached_refresh_token
+            del self._access_token_cache[token]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -636,8 +666,12 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
-                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            claims = jwt_wrapper.verify_and_decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
             )
         except jwt.InvalidTokenError:
             return None
@@ -645,6 +679,10 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._access_token_cache[token] = (
+            refresh_token,
+            claims["exp"] + ACCESS_TOKEN_LEEWAY,
+        )
         return refresh_token
 
     @callback
@@ -7,7 +7,7 @@ import itertools
 from logging import getLogger
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
@@ -278,6 +278,29 @@ class AuthStore:
         perm_lookup = PermissionLookup(ent_reg, dev_reg)
         self._perm_lookup = perm_lookup
 
+        @callback
+        def _async_entity_registry_updated(event: Event) -> None:
+            """Drop cached permission lookups of an updated entity."""
+            perm_lookup.invalidate(event.data["entity_id"])
+            if old_entity_id := event.data.get("old_entity_id"):
+                perm_lookup.invalidate(old_entity_id)
+
+        @callback
+        def _async_device_registry_updated(event: Event) -> None:
+            """Drop all cached permission lookups when a device changes."""
+            perm_lookup.invalidate()
+
+        self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            _async_entity_registry_updated,
+            run_immediately=True,
+        )
+        self.hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            _async_device_registry_updated,
+            run_immediately=True,
+        )
+
         now_ts = dt_util.utcnow().timestamp()
 
         if data is None or not isinstance(data, dict):
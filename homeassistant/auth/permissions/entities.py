@@ -54,29 +54,20 @@ def _lookup_area(
     perm_lookup: PermissionLookup, area_dict: SubCategoryDict, entity_id: str
 ) -> ValueType | None:
     """Look up entity permissions by area."""
-    entity_entry = perm_lookup.entity_registry.async_get(entity_id)
-
-    if entity_entry is None or entity_entry.device_id is None:
+    if (area_id := perm_lookup.device_and_area(entity_id)[1]) is None:
         return None
 
-    device_entry = perm_lookup.device_registry.async_get(entity_entry.device_id)
-
-    if device_entry is None or device_entry.area_id is None:
-        return None
-
-    return area_dict.get(device_entry.area_id)
+    return area_dict.get(area_id)
 
 
 def _lookup_device(
     perm_lookup: PermissionLookup, devices_dict: SubCategoryDict, entity_id: str
 ) -> ValueType | None:
     """Look up entity permissions by device."""
-    entity_entry = perm_lookup.entity_registry.async_get(entity_id)
-
-    if entity_entry is None or entity_entry.device_id is None:
+    if (device_id := perm_lookup.device_and_area(entity_id)[0]) is None:
         return None
 
-    return devices_dict.get(entity_entry.device_id)
+    return devices_dict.get(device_id)
 
 
 def _lookup_entity_id(
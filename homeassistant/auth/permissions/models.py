@@ -15,3 +15,32 @@ class PermissionLookup:
 
     entity_registry: er.EntityRegistry = attr.ib()
     device_registry: dr.DeviceRegistry = attr.ib()
+    _device_and_area: dict[str, tuple[str | None, str | None]] = attr.ib(
+        factory=dict, init=False
+    )
+
+    def device_and_area(self, entity_id: str) -> tuple[str | None, str | None]:
+        """Return the device id and the area id of the device of an entity.
+
+        The result is cached until invalidate is called, which the auth store
+        does when the entity or device registry is updated.
+        """
+        if (cached := self._device_and_area.get(entity_id)) is not None:
+            return cached
+
+        device_id = area_id = None
+        if (entity_entry := self.entity_registry.async_get(entity_id)) is not None and (
+            device_id := entity_entry.device_id
+        ) is not None:
+            if (device_entry := self.device_registry.async_get(device_id)) is not None:
+                area_id = device_entry.area_id
+
+        result = self._device_and_area[entity_id] = (device_id, area_id)
+        return result
+
+    def invalidate(self, entity_id: str | None = None) -> None:
+        """Drop the cached lookups of an entity, or of all entities."""
+        if entity_id is None:
+            self._device_and_area.clear()
+        else:
+            self._device_and_area.pop(entity_id, None)
@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import TraceLevel
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -84,6 +85,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_disable,
     trace_get,
     trace_path,
 )
@@ -616,20 +618,23 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                     automation_trace.set_error(err)
                     return None
 
-            # Prepare tracing the automation
-            automation_trace.set_trace(trace_get())
-
             # Set trigger reason
             trigger_description = variables.get("trigger", {}).get("description")
             automation_trace.set_trigger_description(trigger_description)
 
-            # Add initial variables as the trigger step
-            if "trigger" in variables and "idx" in variables["trigger"]:
-                trigger_path = f"trigger/{variables['trigger']['idx']}"
+            if automation_trace.level == TraceLevel.OFF:
+                trace_disable()
             else:
-                trigger_path = "trigger"
-            trace_element = TraceElement(variables, trigger_path)
-            trace_append_element(trace_element)
+                # Prepare tracing the automation
+                automation_trace.set_trace(trace_get())
+
+                # Add initial variables as the trigger step
+                if "trigger" in variables and "idx" in variables["trigger"]:
+                    trigger_path = f"trigger/{variables['trigger']['idx']}"
+                else:
+                    trigger_path = "trigger"
+                trace_element = TraceElement(variables, trigger_path)
+                trace_append_element(trace_element)
 
             if (
                 not skip_condition
@@ -930,13 +935,17 @@ async def _async_process_config(
         automation_matches: set[int] = set()
         config_matches: set[int] = set()
         automation_configs_with_id: dict[str, tuple[int, AutomationEntityConfig]] = {}
-        automation_configs_without_id: list[tuple[int, AutomationEntityConfig]] = []
+        automation_configs_without_id: dict[
+            str, list[tuple[int, AutomationEntityConfig]]
+        ] = {}
 
         for config_idx, config in enumerate(automation_configs):
             if automation_id := config.config_block.get(CONF_ID):
                 automation_configs_with_id[automation_id] = (config_idx, config)
                 continue
-            automation_configs_without_id.append((config_idx, config))
+            automation_configs_without_id.setdefault(
+                _automation_name(config), []
+            ).append((config_idx, config))
 
         for automation_idx, automation in enumerate(automations):
             if automation.unique_id:
@@ -950,13 +959,16 @@ async def _async_process_config(
                     config_matches.add(config_idx)
                 continue
 
-            for config_idx, config in automation_configs_without_id:
-                if config_idx in config_matches:
-                    # Only allow an automation config to match at most once
-                    continue
+            # Configurations can only match automations with the same name
+            if not isinstance(name := automation.name, str):
+                continue
+            candidates = automation_configs_without_id.get(name, [])
+            for candidate_idx, (config_idx, config) in enumerate(candidates):
                 if automation_matches_config(automation, config):
                     automation_matches.add(automation_idx)
                     config_matches.add(config_idx)
+                    # Only allow an automation config to match at most once
+                    del candidates[candidate_idx]
                     # Only allow an automation to match at most once
                     break
 
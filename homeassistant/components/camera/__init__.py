@@ -81,6 +81,7 @@ from .const import (  # noqa: F401
     SERVICE_RECORD,
     StreamType,
 )
+from .image_cache import CameraImageCache
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 
@@ -180,35 +181,51 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    Concurrent requests for the same size are coalesced
+    and, if the camera sets an image cache time to live,
+    the result is cached on the camera.
     """
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
-                    camera, width=width, height=height, wait_for_next_keyframe=False
-                )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
+            if image := await camera.image_cache.async_get(
+                camera.hass,
+                (width, height),
+                partial(_async_fetch_image, camera, width, height),
+                camera.image_cache_ttl,
+            ):
                 return image
 
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_fetch_image(
+    camera: Camera,
+    width: int | None = None,
+    height: int | None = None,
+) -> Image | None:
+    """Fetch and scale a snapshot image from a camera, bypassing the cache."""
+    image_bytes = (
+        await _async_get_stream_image(
+            camera, width=width, height=height, wait_for_next_keyframe=False
+        )
+        if camera.use_stream_for_stills
+        else await camera.async_camera_image(width=width, height=height)
+    )
+    if not image_bytes:
+        return None
+    content_type = camera.content_type
+    image = Image(content_type, image_bytes)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        return Image(content_type, scale_jpeg_camera_image(image, width, height))
+
+    return image
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -470,6 +487,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "brand",
     "frame_interval",
     "frontend_stream_type",
+    "image_cache_ttl",
     "is_on",
     "is_recording",
     "is_streaming",
@@ -490,6 +508,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_brand: str | None = None
     _attr_frame_interval: float = MIN_STREAM_INTERVAL
     _attr_frontend_stream_type: StreamType | None
+    _attr_image_cache_ttl: float = 0
     _attr_is_on: bool = True
     _attr_is_recording: bool = False
     _attr_is_streaming: bool = False
@@ -509,6 +528,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self.image_cache = CameraImageCache()
 
     @property
     def entity_picture(self) -> str:
@@ -570,6 +590,11 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @cached_property
+    def image_cache_ttl(self) -> float:
+        """Return the number of seconds a still image may be served from cache."""
+        return self._attr_image_cache_ttl
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
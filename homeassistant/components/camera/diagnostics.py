@@ -25,7 +25,8 @@ async def async_get_config_entry_diagnostics(
             camera = _get_camera_from_entity_id(hass, entity.entity_id)
         except HomeAssistantError:
             continue
-        diagnostics[entity.entity_id] = (
-            camera.stream.get_diagnostics() if camera.stream else {}
-        )
+        camera_diagnostics = camera.stream.get_diagnostics() if camera.stream else {}
+        if image_cache := camera.image_cache.as_dict():
+            camera_diagnostics["image_cache"] = image_cache
+        diagnostics[entity.entity_id] = camera_diagnostics
     return diagnostics
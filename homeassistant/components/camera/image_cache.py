@@ -0,0 +1,145 @@
+"""Snapshot cache for camera entities.
+
+Dashboards commonly poll the same camera thumbnails from many clients at
+once. The cache coalesces concurrent fetches for the same requested size
+into a single call to the camera. Cameras that opt in with a time to live
+also keep the result for that long so that scaled images are only produced
+once per refresh.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from . import Image
+
+CacheKey = tuple[int | None, int | None]
+
+IMAGE_CACHE_MAX_ENTRIES: Final = 8
+IMAGE_CACHE_MAX_BYTES: Final = 8 * 1024 * 1024
+
+
+def _consume_exception(task: asyncio.Future[Image | None]) -> None:
+    """Mark the exception of a finished fetch as retrieved."""
+    if not task.cancelled():
+        task.exception()
+
+
+class CameraImageCache:
+    """Cache camera images per requested width and height.
+
+    Entries expire after ``ttl`` seconds; with a ttl of zero only
+    concurrent fetches are coalesced. The cache is bounded both by the
+    number of distinct sizes and by the total number of bytes held; the
+    least recently used entries are evicted first. Failed fetches are
+    never cached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = IMAGE_CACHE_MAX_ENTRIES,
+        max_bytes: int = IMAGE_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache."""
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, tuple[float, Image]] = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Future[Image | None]] = {}
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    async def async_get(
+        self,
+        hass: HomeAssistant,
+        key: CacheKey,
+        fetch: Callable[[], Awaitable[Image | None]],
+        ttl: float = 0,
+    ) -> Image | None:
+        """Return a cached image for key or fetch it.
+
+        Concurrent callers asking for the same key while a fetch is in
+        progress wait for that fetch instead of starting a new one. The
+        fetch runs in its own background task so a caller timing out does
+        not cancel it for the other waiters.
+        """
+        if (entry := self._entries.get(key)) is not None:
+            if time.monotonic() - entry[0] < ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self._remove(key)
+
+        if (future := self._inflight.get(key)) is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        self.misses += 1
+        task = hass.async_create_background_task(
+            self._async_fetch(key, fetch, ttl), f"camera image fetch {key}"
+        )
+        # Retrieve the exception in case every waiter has given up
+        task.add_done_callback(_consume_exception)
+        self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self,
+        key: CacheKey,
+        fetch: Callable[[], Awaitable[Image | None]],
+        ttl: float,
+    ) -> Image | None:
+        """Fetch an image and store it in the cache."""
+        try:
+            image = await fetch()
+        finally:
+            del self._inflight[key]
+        if image is not None and ttl > 0:
+            self._store(key, image)
+        return image
+
+    def _store(self, key: CacheKey, image: Image) -> None:
+        """Store an image, evicting the least recently used entries."""
+        if key in self._entries:
+            self._remove(key)
+        if (image_size := len(image.content)) > self._max_bytes:
+            return
+        self._entries[key] = (time.monotonic(), image)
+        self._size += image_size
+        while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove an entry from the cache."""
+        _, image = self._entries.pop(key)
+        self._size -= len(image.content)
+
+    def clear(self) -> None:
+        """Drop all cached images."""
+        self._entries.clear()
+        self._size = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cache metrics as a debug dictionary."""
+        requests = self.hits + self.misses + self.coalesced
+        if not requests:
+            return {}
+        return {
+            "requests": requests,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.coalesced) / requests, 3),
+            "entries": len(self._entries),
+            "bytes": self._size,
+        }
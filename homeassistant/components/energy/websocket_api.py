@@ -4,11 +4,11 @@ from __future__ import annotations
 import asyncio
 from collections import defaultdict
 from collections.abc import Awaitable, Callable
-from datetime import timedelta
+from datetime import datetime, timedelta
 import functools
 from itertools import chain
 from types import ModuleType
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 import voluptuous as vol
 
@@ -21,12 +21,14 @@ from homeassistant.helpers.integration_platform import (
 )
 from homeassistant.helpers.singleton import singleton
 from homeassistant.util import dt as dt_util
+from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from .const import DOMAIN
 from .data import (
     DEVICE_CONSUMPTION_SCHEMA,
     ENERGY_SOURCE_SCHEMA,
     EnergyManager,
+    EnergyPreferences,
     EnergyPreferencesUpdate,
     async_get_manager,
 )
@@ -42,6 +44,13 @@ AsyncEnergyWebSocketCommandHandler = Callable[
     Awaitable[None],
 ]
 
+DashboardDataCacheKey = tuple[float, float, str, tuple[str, ...], str | None]
+
+# Number of dashboard responses for periods in the past which are kept
+DASHBOARD_DATA_CACHE_SIZE = 16
+# Fossil energy consumption series in the dashboard data
+FOSSIL_ENERGY_CONSUMPTION = "fossil_energy_consumption"
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -52,6 +61,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_validate)
     websocket_api.async_register_command(hass, ws_solar_forecast)
     websocket_api.async_register_command(hass, ws_get_fossil_energy_consumption)
+    websocket_api.async_register_command(hass, ws_get_dashboard_data)
 
 
 @singleton("energy_platforms")
@@ -231,6 +241,89 @@ async def ws_solar_forecast(
     connection.send_result(msg["id"], forecasts)
 
 
+def _combine_change_statistics(
+    stats: dict[str, list[StatisticsRow]], statistic_ids: list[str]
+) -> dict[float, float]:
+    """Combine multiple statistics, returns a dict indexed by start time."""
+    result: defaultdict[float, float] = defaultdict(float)
+
+    for statistics_id, stat in stats.items():
+        if statistics_id not in statistic_ids:
+            continue
+        for period in stat:
+            if period["change"] is None:
+                continue
+            result[period["start"]] += period["change"]
+
+    return {key: result[key] for key in sorted(result)}
+
+
+def _reduce_deltas(
+    stat_list: list[dict[str, Any]],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+    period: timedelta,
+) -> list[dict[str, Any]]:
+    """Reduce hourly deltas to daily or monthly deltas."""
+    result: list[dict[str, Any]] = []
+    deltas: list[float] = []
+    if not stat_list:
+        return result
+    prev_stat: dict[str, Any] = stat_list[0]
+    fake_stat = {"start": stat_list[-1]["start"] + period.total_seconds()}
+
+    # Loop over the hourly deltas + a fake entry to end the period
+    for statistic in chain(stat_list, (fake_stat,)):
+        if not same_period(prev_stat["start"], statistic["start"]):
+            start, _ = period_start_end(prev_stat["start"])
+            # The previous statistic was the last entry of the period
+            result.append({"start": start, "delta": sum(deltas)})
+            deltas = []
+        if statistic.get("delta") is not None:
+            deltas.append(statistic["delta"])
+        prev_stat = statistic
+
+    return result
+
+
+def _fossil_energy_deltas(
+    statistics: dict[str, list[StatisticsRow]],
+    energy_statistic_ids: list[str],
+    co2_statistic_id: str,
+    period: str,
+) -> list[dict[str, Any]]:
+    """Calculate the fossil based energy per period from hourly statistics."""
+    merged_energy_statistics = _combine_change_statistics(
+        statistics, energy_statistic_ids
+    )
+    indexed_co2_statistics = cast(
+        dict[float, float],
+        {
+            period["start"]: period["mean"]
+            for period in statistics.get(co2_statistic_id, {})
+        },
+    )
+
+    # Calculate amount of fossil based energy, assume 100% fossil if missing
+    fossil_energy = [
+        {"start": start, "delta": delta * indexed_co2_statistics.get(start, 100) / 100}
+        for start, delta in merged_energy_statistics.items()
+    ]
+
+    if period == "hour":
+        return fossil_energy
+
+    if period == "day":
+        same_period, period_start_end = recorder.statistics.reduce_day_ts_factory()
+    elif period == "week":
+        same_period, period_start_end = recorder.statistics.reduce_week_ts_factory()
+    else:
+        same_period, period_start_end = recorder.statistics.reduce_month_ts_factory()
+    return _reduce_deltas(
+        fossil_energy, same_period, period_start_end, timedelta(days=1)
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "energy/fossil_energy_consumption",
@@ -278,99 +371,185 @@ async def ws_get_fossil_energy_consumption(
         {"mean", "change"},
     )
 
-    def _combine_change_statistics(
-        stats: dict[str, list[StatisticsRow]], statistic_ids: list[str]
-    ) -> dict[float, float]:
-        """Combine multiple statistics, returns a dict indexed by start time."""
-        result: defaultdict[float, float] = defaultdict(float)
+    reduced_fossil_energy = _fossil_energy_deltas(
+        statistics, msg["energy_statistic_ids"], msg["co2_statistic_id"], msg["period"]
+    )
+    result = {
+        dt_util.utc_from_timestamp(period["start"]).isoformat(): period["delta"]
+        for period in reduced_fossil_energy
+    }
+    connection.send_result(msg["id"], result)
 
-        for statistics_id, stat in stats.items():
-            if statistics_id not in statistic_ids:
-                continue
-            for period in stat:
-                if period["change"] is None:
-                    continue
-                result[period["start"]] += period["change"]
-
-        return {key: result[key] for key in sorted(result)}
-
-    def _reduce_deltas(
-        stat_list: list[dict[str, Any]],
-        same_period: Callable[[float, float], bool],
-        period_start_end: Callable[[float], tuple[float, float]],
-        period: timedelta,
-    ) -> list[dict[str, Any]]:
-        """Reduce hourly deltas to daily or monthly deltas."""
-        result: list[dict[str, Any]] = []
-        deltas: list[float] = []
-        if not stat_list:
-            return result
-        prev_stat: dict[str, Any] = stat_list[0]
-        fake_stat = {"start": stat_list[-1]["start"] + period.total_seconds()}
-
-        # Loop over the hourly deltas + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_stat,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, _ = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                result.append(
-                    {
-                        "start": dt_util.utc_from_timestamp(start).isoformat(),
-                        "delta": sum(deltas),
-                    }
-                )
-                deltas = []
-            if statistic.get("delta") is not None:
-                deltas.append(statistic["delta"])
-            prev_stat = statistic
 
-        return result
+@singleton("energy_dashboard_data_cache")
+@callback
+def _async_get_dashboard_data_cache(
+    hass: HomeAssistant,
+) -> LimitedSizeDict[DashboardDataCacheKey, dict[str, Any]]:
+    """Return the cache of dashboard data for periods in the past."""
+    return LimitedSizeDict(size_limit=DASHBOARD_DATA_CACHE_SIZE)
+
+
+def _energy_statistic_ids(
+    prefs: EnergyPreferences, cost_sensors: dict[str, str]
+) -> tuple[list[str], list[str]]:
+    """Return all statistic ids and the grid consumption statistic ids.
+
+    Costs of sources priced with an entity or a fixed price come from the
+    cost sensors created by the energy integration.
+    """
+    statistic_ids: list[str] = []
+    grid_consumption_ids: list[str] = []
+    for source in prefs["energy_sources"]:
+        if source["type"] == "grid":
+            for flow_from in source["flow_from"]:
+                grid_consumption_ids.append(flow_from["stat_energy_from"])
+                statistic_ids.append(flow_from["stat_energy_from"])
+                if stat_cost := flow_from.get("stat_cost") or cost_sensors.get(
+                    flow_from["stat_energy_from"]
+                ):
+                    statistic_ids.append(stat_cost)
+            for flow_to in source["flow_to"]:
+                statistic_ids.append(flow_to["stat_energy_to"])
+                if stat_compensation := flow_to.get(
+                    "stat_compensation"
+                ) or cost_sensors.get(flow_to["stat_energy_to"]):
+                    statistic_ids.append(stat_compensation)
+            continue
+        statistic_ids.append(source["stat_energy_from"])
+        if source["type"] == "battery":
+            statistic_ids.append(source["stat_energy_to"])
+        elif (source["type"] == "gas" or source["type"] == "water") and (
+            stat_cost := source.get("stat_cost")
+            or cost_sensors.get(source["stat_energy_from"])
+        ):
+            statistic_ids.append(stat_cost)
+    statistic_ids.extend(
+        device["stat_consumption"] for device in prefs["device_consumption"]
+    )
+    return list(dict.fromkeys(statistic_ids)), grid_consumption_ids
 
-    merged_energy_statistics = _combine_change_statistics(
-        statistics, msg["energy_statistic_ids"]
+
+def _get_dashboard_data(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "hour", "day", "week", "month"],
+    statistic_ids: list[str],
+    grid_consumption_ids: list[str],
+    co2_statistic_id: str | None,
+) -> dict[str, Any]:
+    """Fetch all dashboard statistics and arrange them in columns.
+
+    This method should be run in the recorder executor.
+    """
+    units: dict[str, str] = {"energy": UnitOfEnergy.KILO_WATT_HOUR}
+    statistics = recorder.statistics.statistics_during_period(
+        hass, start_time, end_time, set(statistic_ids), period, units, {"change"}
     )
-    indexed_co2_statistics = cast(
-        dict[float, float],
-        {
-            period["start"]: period["mean"]
-            for period in statistics.get(msg["co2_statistic_id"], {})
+    columns: dict[str, dict[float, float | None]] = {
+        statistic_id: {row["start"]: row["change"] for row in rows}
+        for statistic_id, rows in statistics.items()
+    }
+
+    if co2_statistic_id is not None:
+        hourly_statistics = recorder.statistics.statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            {*grid_consumption_ids, co2_statistic_id},
+            "hour",
+            units,
+            {"mean", "change"},
+        )
+        columns[FOSSIL_ENERGY_CONSUMPTION] = {
+            row["start"]: row["delta"]
+            for row in _fossil_energy_deltas(
+                hourly_statistics,
+                grid_consumption_ids,
+                co2_statistic_id,
+                "hour" if period == "5minute" else period,
+            )
+        }
+
+    starts = sorted({start for column in columns.values() for start in column})
+    return {
+        "start": [int(start * 1000) for start in starts],
+        "series": {
+            statistic_id: [column.get(start) for start in starts]
+            for statistic_id, column in columns.items()
         },
-    )
+    }
 
-    # Calculate amount of fossil based energy, assume 100% fossil if missing
-    fossil_energy = [
-        {"start": start, "delta": delta * indexed_co2_statistics.get(start, 100) / 100}
-        for start, delta in merged_energy_statistics.items()
-    ]
 
-    if msg["period"] == "hour":
-        reduced_fossil_energy = [
-            {
-                "start": dt_util.utc_from_timestamp(period["start"]).isoformat(),
-                "delta": period["delta"],
-            }
-            for period in fossil_energy
-        ]
-
-    elif msg["period"] == "day":
-        _same_day_ts, _day_start_end_ts = recorder.statistics.reduce_day_ts_factory()
-        reduced_fossil_energy = _reduce_deltas(
-            fossil_energy,
-            _same_day_ts,
-            _day_start_end_ts,
-            timedelta(days=1),
-        )
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "energy/dashboard_data",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("period"): vol.Any("5minute", "hour", "day", "week", "month"),
+        vol.Optional("co2_statistic_id"): str,
+    }
+)
+@_ws_with_manager
+async def ws_get_dashboard_data(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    manager: EnergyManager,
+) -> None:
+    """Return the statistics of all configured energy sources and devices.
+
+    The result is columnar: a list of period start times in milliseconds and
+    for each statistic a list of changes aligned with the start times. Results
+    for periods which ended more than an hour ago are cached.
+    """
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
     else:
-        (
-            _same_month_ts,
-            _month_start_end_ts,
-        ) = recorder.statistics.reduce_month_ts_factory()
-        reduced_fossil_energy = _reduce_deltas(
-            fossil_energy,
-            _same_month_ts,
-            _month_start_end_ts,
-            timedelta(days=1),
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    end_time: datetime | None = None
+    if end_time_str := msg.get("end_time"):
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+
+    if manager.data is None:
+        connection.send_result(msg["id"], {"start": [], "series": {}})
+        return
+
+    statistic_ids, grid_consumption_ids = _energy_statistic_ids(
+        manager.data, hass.data[DOMAIN]["cost_sensors"]
+    )
+    co2_statistic_id: str | None = msg.get("co2_statistic_id")
+    cache = _async_get_dashboard_data_cache(hass)
+    cache_key: DashboardDataCacheKey | None = None
+    if end_time is not None and end_time < dt_util.utcnow() - timedelta(hours=1):
+        cache_key = (
+            start_time.timestamp(),
+            end_time.timestamp(),
+            msg["period"],
+            tuple(statistic_ids),
+            co2_statistic_id,
         )
+        if (result := cache.get(cache_key)) is not None:
+            connection.send_result(msg["id"], result)
+            return
 
-    result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
+    result = await recorder.get_instance(hass).async_add_executor_job(
+        _get_dashboard_data,
+        hass,
+        start_time,
+        end_time,
+        msg["period"],
+        statistic_ids,
+        grid_consumption_ids,
+        co2_statistic_id,
+    )
+    if cache_key is not None:
+        cache[cache_key] = result
     connection.send_result(msg["id"], result)
@@ -556,6 +556,10 @@ class Group(Entity):
         self._set_tracked(entity_ids)
         self._on_off: dict[str, bool] = {}
         self._assumed: dict[str, bool] = {}
+        # The number of True values in _on_off and _assumed, kept up to date
+        # as members change so the group state does not iterate all members
+        self._on_count = 0
+        self._assumed_count = 0
         self._on_states: set[str] = set()
         self.created_by_service = created_by_service
         self.mode = any
@@ -784,6 +788,8 @@ class Group(Entity):
         """Reset tracked state."""
         self._on_off = {}
         self._assumed = {}
+        self._on_count = 0
+        self._assumed_count = 0
         self._on_states = set()
 
         for entity_id in self.trackable:
@@ -796,7 +802,9 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry: GroupIntegrationRegistry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        self._assumed_count += assumed - self._assumed.get(entity_id, False)
+        self._assumed[entity_id] = assumed
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -804,12 +812,20 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            is_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in registry.on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            is_on = state in entity_on_state
+        self._on_count += is_on - self._on_off.get(entity_id, False)
+        self._on_off[entity_id] = is_on
+
+    def _mode_matches(self, count: int, total: int) -> bool:
+        """Return the group mode applied to members of which count are true."""
+        if self.mode is all:
+            return count == total
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state: State | None = None) -> None:
@@ -832,7 +848,9 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._mode_matches(
+                self._assumed_count, len(self._assumed)
+            )
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -852,7 +870,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_matches(self._on_count, len(self._on_off))
         if group_is_on:
             self._state = on_state
         else:
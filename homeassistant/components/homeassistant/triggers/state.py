@@ -1,7 +1,8 @@
 """Offer state listening automation rules."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import timedelta
 import logging
 
@@ -32,6 +33,8 @@ CONF_TO = "to"
 CONF_NOT_FROM = "not_from"
 CONF_NOT_TO = "not_to"
 
+DATA_STATE_TRIGGER_INDEX = "state_trigger_index"
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -61,6 +64,111 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+StateTriggerListener = Callable[[EventType[EventStateChangedData]], None]
+
+
+@dataclass(slots=True)
+class _EntityStateTriggers:
+    """State triggers attached to a single entity."""
+
+    unsub: CALLBACK_TYPE
+    # Triggers that can only fire for specific new states, keyed by state
+    by_to_state: dict[str, list[StateTriggerListener]] = field(default_factory=dict)
+    # Triggers that have to look at every state change
+    any_state: list[StateTriggerListener] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        """Return if no triggers are attached."""
+        return not self.by_to_state and not self.any_state
+
+
+class StateTriggerIndex:
+    """Route state changed events to state triggers.
+
+    All state triggers share a single state change listener per entity.
+    Triggers that only fire for specific target states are bucketed by
+    those states, so a state change only evaluates the triggers that can
+    match its new state.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._entities: dict[str, _EntityStateTriggers] = {}
+
+    @callback
+    def async_add_listener(
+        self,
+        entity_ids: Iterable[str],
+        to_states: Iterable[str] | None,
+        listener: StateTriggerListener,
+    ) -> CALLBACK_TYPE:
+        """Add a listener for the entities.
+
+        If to_states is not None, the listener is only called for state
+        changes to one of those states.
+        """
+        entity_ids = list(entity_ids)
+        states = None if to_states is None else set(to_states)
+        for entity_id in entity_ids:
+            if (entity_triggers := self._entities.get(entity_id)) is None:
+                entity_triggers = self._entities[entity_id] = _EntityStateTriggers(
+                    async_track_state_change_event(
+                        self._hass, entity_id, self._async_state_changed
+                    )
+                )
+            if states is None:
+                entity_triggers.any_state.append(listener)
+                continue
+            for state in states:
+                entity_triggers.by_to_state.setdefault(state, []).append(listener)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the listener."""
+            for entity_id in entity_ids:
+                entity_triggers = self._entities[entity_id]
+                if states is None:
+                    entity_triggers.any_state.remove(listener)
+                for state in states or ():
+                    listeners = entity_triggers.by_to_state[state]
+                    listeners.remove(listener)
+                    if not listeners:
+                        del entity_triggers.by_to_state[state]
+                if entity_triggers.empty:
+                    entity_triggers.unsub()
+                    del self._entities[entity_id]
+
+        return async_remove
+
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Dispatch a state change to the triggers that can match it."""
+        entity_id = event.data["entity_id"]
+        entity_triggers = self._entities[entity_id]
+        listeners = entity_triggers.any_state.copy()
+        if (new_state := event.data["new_state"]) is not None and (
+            targeted := entity_triggers.by_to_state.get(new_state.state)
+        ):
+            listeners.extend(targeted)
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s", entity_id, listener
+                )
+
+
+@callback
+def _async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -225,7 +333,15 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # Triggers on specific target states of the state itself are only
+    # dispatched state changes to those states
+    to_states: Iterable[str] | None = None
+    if attribute is None and to_state is not None and to_state != MATCH_ALL:
+        to_states = [to_state] if isinstance(to_state, str) else to_state
+
+    unsub = _async_get_state_trigger_index(hass).async_add_listener(
+        entity_ids, to_states, state_automation_listener
+    )
 
     @callback
     def async_remove() -> None:
@@ -1,14 +1,24 @@
 """Static file handling for HTTP component."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass
+import math
 import mimetypes
 from pathlib import Path
+import time
 from typing import Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
-from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
+from aiohttp.helpers import ETAG_ANY, ETag
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
+from aiohttp.web_exceptions import (
+    HTTPForbidden,
+    HTTPNotFound,
+    HTTPNotModified,
+    HTTPPreconditionFailed,
+)
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
 
@@ -21,6 +31,147 @@ CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {hdrs.CACHE_CONTROL: CACHE_HEADER}
 PATH_CACHE: LRU[tuple[str, Path], tuple[Path | None, str | None]] = LRU(512)
 
+# Files up to this size are kept in memory, larger files are sent from disk
+CONTENT_CACHE_MAX_FILE_SIZE: Final = 512 * 1024
+CONTENT_CACHE_MAX_SIZE: Final = 16 * 1024 * 1024
+# Seconds before a cached file is checked for changes on disk
+CONTENT_CACHE_REVALIDATE: Final = 10
+
+
+# Modification time in nanoseconds and size of a file
+_FileStat = tuple[int, int]
+
+
+@dataclass(slots=True)
+class _CachedFile:
+    """Content of a static file and of its gzip compressed sibling."""
+
+    signature: tuple[_FileStat, _FileStat | None]
+    body: bytes
+    gzip_body: bytes | None
+    checked_at: float
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes held."""
+        return len(self.body) + len(self.gzip_body or b"")
+
+
+def _stat_file(filepath: Path) -> _FileStat:
+    """Return the modification time and size of a file."""
+    stat = filepath.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_file(
+    filepath: Path, cached_signature: tuple[_FileStat, _FileStat | None] | None
+) -> tuple[tuple[_FileStat, _FileStat | None], bytes | None, bytes | None]:
+    """Load a file and its gzip compressed sibling.
+
+    The content is not read if neither file changed or if the file is too
+    large to be kept in memory. This method should be run in the executor.
+    """
+    file_stat = _stat_file(filepath)
+    gzip_path = filepath.with_name(f"{filepath.name}.gz")
+    try:
+        gzip_stat: _FileStat | None = _stat_file(gzip_path)
+    except OSError:
+        gzip_stat = None
+    signature = (file_stat, gzip_stat)
+    if signature == cached_signature or file_stat[1] > CONTENT_CACHE_MAX_FILE_SIZE:
+        return signature, None, None
+    body = filepath.read_bytes()
+    gzip_body: bytes | None = None
+    if gzip_stat is not None:
+        try:
+            gzip_body = gzip_path.read_bytes()
+        except OSError:
+            signature = (file_stat, None)
+    return signature, body, gzip_body
+
+
+class StaticContentCache:
+    """Keep small static files in memory.
+
+    Cached files are served without touching the disk and are checked for
+    changes at most every CONTENT_CACHE_REVALIDATE seconds. Files too large
+    to be held are remembered as well, so they are only checked as often.
+    The least recently used files are evicted once more than max_size bytes
+    are held.
+    """
+
+    def __init__(self, max_size: int = CONTENT_CACHE_MAX_SIZE) -> None:
+        """Initialize the cache."""
+        self._max_size = max_size
+        self._size = 0
+        self._files: OrderedDict[Path, _CachedFile] = OrderedDict()
+        self._too_large: LRU[
+            Path, tuple[tuple[_FileStat, _FileStat | None], float]
+        ] = LRU(512)
+
+    async def async_get(
+        self, hass: HomeAssistant, filepath: Path
+    ) -> _CachedFile | None:
+        """Return the content of a file, or None if it is too large.
+
+        Raises OSError if the file can no longer be read.
+        """
+        now = time.monotonic()
+        if (cached := self._files.get(filepath)) is not None:
+            self._files.move_to_end(filepath)
+            if now - cached.checked_at < CONTENT_CACHE_REVALIDATE:
+                return cached
+        elif (too_large := self._too_large.get(filepath)) is not None:
+            if now - too_large[1] < CONTENT_CACHE_REVALIDATE:
+                return None
+
+        try:
+            signature, body, gzip_body = await hass.async_add_executor_job(
+                _load_file, filepath, cached.signature if cached else None
+            )
+        except OSError:
+            self._discard(filepath)
+            raise
+        if cached is not None:
+            if signature == cached.signature:
+                cached.checked_at = now
+                return cached
+            if self._files.get(filepath) is cached:
+                self._remove(filepath)
+        if body is None:
+            self._too_large[filepath] = (signature, now)
+            return None
+        self._too_large.pop(filepath, None)
+
+        loaded = _CachedFile(signature, body, gzip_body, now)
+        if loaded.size <= self._max_size:
+            if filepath in self._files:
+                self._remove(filepath)
+            self._files[filepath] = loaded
+            self._size += loaded.size
+            while self._size > self._max_size:
+                self._remove(next(iter(self._files)))
+        return loaded
+
+    def _remove(self, filepath: Path) -> None:
+        """Remove a file from the cache."""
+        self._size -= self._files.pop(filepath).size
+
+    def _discard(self, filepath: Path) -> None:
+        """Forget everything known about a file."""
+        if filepath in self._files:
+            self._remove(filepath)
+        self._too_large.pop(filepath, None)
+
+    def clear(self) -> None:
+        """Drop all cached files."""
+        self._files.clear()
+        self._too_large.clear()
+        self._size = 0
+
+
+CONTENT_CACHE = StaticContentCache()
+
 
 def _get_file_path(rel_url: str, directory: Path) -> Path | None:
     """Return the path to file on disk or None."""
@@ -72,6 +223,17 @@ class CachingStaticResource(StaticResource):
             filepath, content_type = filepath_content_type
 
         if filepath and content_type:
+            if hdrs.RANGE not in request.headers:
+                try:
+                    cached = await CONTENT_CACHE.async_get(
+                        request.app[KEY_HASS], filepath
+                    )
+                except OSError as error:
+                    # The file was removed after its path was resolved
+                    PATH_CACHE.pop(key, None)
+                    raise HTTPNotFound() from error
+                if cached:
+                    return _cached_file_response(request, cached, content_type)
             return FileResponse(
                 filepath,
                 chunk_size=self._chunk_size,
@@ -82,3 +244,77 @@ class CachingStaticResource(StaticResource):
             )
 
         return await super()._handle(request)
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """Return if the client accepts a gzip encoded response."""
+    for coding in request.headers.get(hdrs.ACCEPT_ENCODING, "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() != "gzip":
+            continue
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def _strong_etag_match(etag: str, etags: tuple[ETag, ...]) -> bool:
+    """Return if an etag matches one of the etags of a conditional request."""
+    if len(etags) == 1 and etags[0].value == ETAG_ANY:
+        return True
+    return any(not match.is_weak and match.value == etag for match in etags)
+
+
+def _cached_file_response(
+    request: Request, cached: _CachedFile, content_type: str
+) -> Response:
+    """Return a response for a file held in memory.
+
+    Conditional requests are answered like FileResponse does for the
+    representation that is sent.
+    """
+    headers: dict[str, str] = {
+        hdrs.CACHE_CONTROL: CACHE_HEADER,
+        hdrs.CONTENT_TYPE: content_type,
+    }
+    body = cached.body
+    (mtime_ns, size), gzip_stat = cached.signature
+    if cached.gzip_body is not None and gzip_stat is not None:
+        headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        if _accepts_gzip(request):
+            body = cached.gzip_body
+            mtime_ns, size = gzip_stat
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+    etag = f"{mtime_ns:x}-{size:x}"
+    mtime = mtime_ns / 1_000_000_000
+    headers[hdrs.ETAG] = f'"{etag}"'
+    headers[hdrs.LAST_MODIFIED] = time.strftime(
+        "%a, %d %b %Y %H:%M:%S GMT", time.gmtime(math.ceil(mtime))
+    )
+
+    if_match = request.if_match
+    if if_match is not None and not _strong_etag_match(etag, if_match):
+        raise HTTPPreconditionFailed
+    if (
+        if_match is None
+        and (if_unmodified_since := request.if_unmodified_since) is not None
+        and mtime > if_unmodified_since.timestamp()
+    ):
+        raise HTTPPreconditionFailed
+
+    if_none_match = request.if_none_match
+    if if_none_match is not None and _strong_etag_match(etag, if_none_match):
+        raise HTTPNotModified(headers=headers)
+    if (
+        if_none_match is None
+        and (if_modified_since := request.if_modified_since) is not None
+        and mtime <= if_modified_since.timestamp()
+    ):
+        raise HTTPNotModified(headers=headers)
+
+    return Response(body=body, headers=headers)
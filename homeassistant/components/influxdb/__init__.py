@@ -51,6 +51,7 @@ from homeassistant.helpers.typing import ConfigType
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
+    BATCH_BUFFER_SIZE_MAX,
     BATCH_TIMEOUT,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
@@ -540,8 +541,14 @@ class InfluxThread(threading.Thread):
 
         dropped = 0
 
+        # When a backlog builds up because writes are slower than incoming
+        # events, write it in larger batches to catch up with fewer requests
+        batch_size = min(
+            max(self.queue.qsize(), BATCH_BUFFER_SIZE), BATCH_BUFFER_SIZE_MAX
+        )
+
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(json) < batch_size and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -568,13 +575,19 @@ class InfluxThread(threading.Thread):
         """Write preprocessed events to influxdb, with retry."""
         for retry in range(self.max_tries + 1):
             try:
+                start = time.monotonic()
                 self.influx.write(json)
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                _LOGGER.debug(
+                    WROTE_MESSAGE,
+                    len(json),
+                    time.monotonic() - start,
+                    self.queue.qsize(),
+                )
                 break
             except ValueError as err:
                 _LOGGER.error(err)
@@ -1,14 +1,19 @@
 """Support for Prometheus metrics export."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from functools import partial
+import gzip
 import logging
 import string
+import time
 from typing import Any, TypeVar, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
+from prometheus_client.exposition import CONTENT_TYPE_LATEST, choose_encoder
 from prometheus_client.metrics import MetricWrapperBase
 import voluptuous as vol
 
@@ -25,7 +30,7 @@ from homeassistant.components.cover import (
     ATTR_CURRENT_POSITION,
     ATTR_CURRENT_TILT_POSITION,
 )
-from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES, ATTR_HUMIDITY
 from homeassistant.components.light import ATTR_BRIGHTNESS
 from homeassistant.components.sensor import SensorDeviceClass
@@ -48,7 +53,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import (
@@ -75,6 +80,7 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_SCRAPE_CACHE_TIME = "scrape_cache_time"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -88,6 +94,9 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_FILTER, default={}): entityfilter.FILTER_SCHEMA,
                 vol.Optional(CONF_PROM_NAMESPACE, default=DEFAULT_NAMESPACE): cv.string,
                 vol.Optional(CONF_REQUIRES_AUTH, default=True): cv.boolean,
+                vol.Optional(CONF_SCRAPE_CACHE_TIME, default=0): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
@@ -108,7 +117,11 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
+    hass.http.register_view(
+        PrometheusView(
+            config[DOMAIN][CONF_REQUIRES_AUTH], config[DOMAIN][CONF_SCRAPE_CACHE_TIME]
+        )
+    )
 
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
@@ -718,21 +731,77 @@ class PrometheusMetrics:
         metric.labels(**self._labels(state)).set(value)
 
 
+_RenderKey = tuple[Callable[[prometheus_client.CollectorRegistry], bytes], bool]
+
+
+def _render_metrics(
+    encoder: Callable[[prometheus_client.CollectorRegistry], bytes], compress: bool
+) -> bytes:
+    """Render the registry and optionally gzip it."""
+    body = encoder(prometheus_client.REGISTRY)
+    if compress:
+        # The exposition format compresses well even at the fastest level
+        return gzip.compress(body, compresslevel=1)
+    return body
+
+
 class PrometheusView(HomeAssistantView):
     """Handle Prometheus requests."""
 
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, scrape_cache_time: float = 0) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._scrape_cache_time = scrape_cache_time
+        self._cache: dict[_RenderKey, tuple[float, bytes]] = {}
+        self._renders: dict[_RenderKey, asyncio.Future[bytes]] = {}
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=prometheus_client.generate_latest(prometheus_client.REGISTRY),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
-        )
+        encoder, content_type = choose_encoder(request.headers.get(hdrs.ACCEPT, ""))
+        if content_type == CONTENT_TYPE_LATEST:
+            # Keep the content type used before OpenMetrics was supported
+            content_type = CONTENT_TYPE_TEXT_PLAIN
+        compress = "gzip" in request.headers.get(hdrs.ACCEPT_ENCODING, "")
+        headers: dict[str, str] = {
+            hdrs.CONTENT_TYPE: content_type,
+            hdrs.VARY: f"{hdrs.ACCEPT}, {hdrs.ACCEPT_ENCODING}",
+        }
+        if compress:
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+        body = await self._async_render(request.app[KEY_HASS], (encoder, compress))
+        return web.Response(body=body, headers=headers)
+
+    async def _async_render(self, hass: HomeAssistant, key: _RenderKey) -> bytes:
+        """Render the metrics in the executor.
+
+        Concurrent scrapes share a single render. When a scrape cache
+        time is configured, the last render is reused until it expires.
+        """
+        if (cached := self._cache.get(key)) and time.monotonic() - cached[
+            0
+        ] < self._scrape_cache_time:
+            return cached[1]
+        if (future := self._renders.get(key)) is None:
+            future = self._renders[key] = hass.async_add_executor_job(
+                _render_metrics, *key
+            )
+            future.add_done_callback(partial(self._async_render_done, key))
+        return await asyncio.shield(future)
+
+    @callback
+    def _async_render_done(
+        self, key: _RenderKey, future: asyncio.Future[bytes]
+    ) -> None:
+        """Store a finished render in the cache."""
+        del self._renders[key]
+        # Retrieve the exception even when nothing is cached, the scrapes
+        # awaiting the render may all have been cancelled
+        if future.cancelled() or future.exception() is not None:
+            return
+        if self._scrape_cache_time:
+            self._cache[key] = (time.monotonic(), future.result())
@@ -554,13 +554,18 @@ class Recorder(threading.Thread):
     def _adjust_lru_size(self) -> None:
         """Trigger the LRU adjustment.
 
-        If the number of entities has increased, increase the size of the LRU
-        cache to avoid thrashing.
+        If the number of entities has increased, or the caches evicted
+        entries since the last adjustment, increase the size of the LRU
+        caches to avoid thrashing.
         """
-        if new_size := self.hass.states.async_entity_ids_count() * 2:
-            self.state_attributes_manager.adjust_lru_size(new_size)
-            self.states_meta_manager.adjust_lru_size(new_size)
-            self.statistics_meta_manager.adjust_lru_size(new_size)
+        new_size = self.hass.states.async_entity_ids_count() * 2
+        self.state_attributes_manager.adjust_lru_size(new_size)
+        self.states_meta_manager.adjust_lru_size(new_size)
+        self.statistics_meta_manager.adjust_lru_size(new_size)
+        # The event caches do not depend on the number of entities
+        # and only grow when their working set does not fit
+        self.event_data_manager.adjust_lru_size(0)
+        self.event_type_manager.adjust_lru_size(0)
 
     @callback
     def async_periodic_statistics(self) -> None:
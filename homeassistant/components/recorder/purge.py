@@ -6,8 +6,9 @@ from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.orm.session import Session
 
 from .db_schema import Events, States, StatesMeta
@@ -25,7 +26,7 @@ from .queries import (
     delete_states_meta_rows,
     delete_states_rows,
     delete_statistics_runs_rows,
-    delete_statistics_short_term_rows,
+    delete_statistics_short_term_id_range,
     disconnect_states_rows,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
@@ -34,7 +35,7 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
-    find_short_term_statistics_to_purge,
+    find_short_term_statistics_id_range_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -49,6 +50,9 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# Short term statistics are deleted by id range instead of by a list of ids
+# so a batch is not limited by max_bind_vars
+DEFAULT_SHORT_TERM_STATISTICS_BATCHES_PER_PURGE = 5
 
 
 @retryable_database_job("purge")
@@ -93,14 +97,14 @@ def purge_old_data(
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
         )
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before, instance.max_bind_vars
-        )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
-        if short_term_statistics:
-            _purge_short_term_statistics(session, short_term_statistics)
+        short_term_statistics = _purge_short_term_statistics(
+            session,
+            purge_before,
+            instance.max_bind_vars * DEFAULT_SHORT_TERM_STATISTICS_BATCHES_PER_PURGE,
+        )
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
@@ -440,17 +444,6 @@ def _select_statistics_runs_to_purge(
     return statistic_runs_list
 
 
-def _select_short_term_statistics_to_purge(
-    session: Session, purge_before: datetime, max_bind_vars: int
-) -> list[int]:
-    """Return a list of short term statistics to purge."""
-    statistics = session.execute(
-        find_short_term_statistics_to_purge(purge_before, max_bind_vars)
-    ).all()
-    _LOGGER.debug("Selected %s short term statistics to remove", len(statistics))
-    return [statistic_id for (statistic_id,) in statistics]
-
-
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -558,13 +551,31 @@ def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None
 
 
 def _purge_short_term_statistics(
-    session: Session, short_term_statistics: list[int]
-) -> None:
-    """Delete by id."""
-    deleted_rows = session.execute(
-        delete_statistics_short_term_rows(short_term_statistics)
+    session: Session, purge_before: datetime, batch_size: int
+) -> int:
+    """Delete short term statistics older than purge_before by id range.
+
+    Returns the number of deleted rows.
+    """
+    first_id, last_id = session.execute(
+        find_short_term_statistics_id_range_to_purge(purge_before, batch_size)
+    ).one()
+    if first_id is None:
+        return 0
+    result = cast(
+        CursorResult,
+        session.execute(
+            delete_statistics_short_term_id_range(first_id, last_id, purge_before)
+        ),
+    )
+    deleted_rows: int = result.rowcount
+    _LOGGER.debug(
+        "Deleted %s short term statistics with ids %s-%s",
+        deleted_rows,
+        first_id,
+        last_id,
     )
-    _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+    return deleted_rows
 
 
 def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
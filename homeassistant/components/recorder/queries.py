@@ -578,13 +578,15 @@ def delete_statistics_runs_rows(
     )
 
 
-def delete_statistics_short_term_rows(
-    short_term_statistics: Iterable[int],
+def delete_statistics_short_term_id_range(
+    first_id: int, last_id: int, purge_before: datetime
 ) -> StatementLambdaElement:
-    """Delete statistics_short_term rows."""
+    """Delete statistics_short_term rows in an id range older than purge_before."""
+    purge_before_ts = purge_before.timestamp()
     return lambda_stmt(
         lambda: delete(StatisticsShortTerm)
-        .where(StatisticsShortTerm.id.in_(short_term_statistics))
+        .where(StatisticsShortTerm.id.between(first_id, last_id))
+        .where(StatisticsShortTerm.start_ts < purge_before_ts)
         .execution_options(synchronize_session=False)
     )
 
@@ -634,15 +636,30 @@ def find_states_to_purge(
     )
 
 
-def find_short_term_statistics_to_purge(
-    purge_before: datetime, max_bind_vars: int
+def find_short_term_statistics_id_range_to_purge(
+    purge_before: datetime, batch_size: int
 ) -> StatementLambdaElement:
-    """Find short term statistics to purge."""
+    """Find the id range of the first short term statistics to purge.
+
+    The rows are picked in id order rather than start order, as imported
+    or backfilled statistics do not have ids in start order. The range then
+    holds at most batch_size rows older than purge_before, which can be
+    deleted without binding every id in the statement.
+    """
     purge_before_ts = purge_before.timestamp()
     return lambda_stmt(
-        lambda: select(StatisticsShortTerm.id)
-        .filter(StatisticsShortTerm.start_ts < purge_before_ts)
-        .limit(max_bind_vars)
+        lambda: select(
+            func.min(
+                (
+                    oldest := select(StatisticsShortTerm.id)
+                    .filter(StatisticsShortTerm.start_ts < purge_before_ts)
+                    .order_by(StatisticsShortTerm.id)
+                    .limit(batch_size)
+                    .subquery()
+                ).c.id
+            ),
+            func.max(oldest.c.id),
+        )
     )
 
 
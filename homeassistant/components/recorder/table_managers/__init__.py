@@ -1,6 +1,6 @@
 """Managers for each table."""
 
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from lru import LRU
 
@@ -9,6 +9,10 @@ if TYPE_CHECKING:
 
 _DataT = TypeVar("_DataT")
 
+# The LRU caches grow by this factor when they evicted entries since the
+# last adjustment, up to the limit passed to the table manager.
+LRU_GROWTH_FACTOR = 1.5
+
 
 class BaseTableManager(Generic[_DataT]):
     """Base class for table managers."""
@@ -55,21 +59,56 @@ class BaseTableManager(Generic[_DataT]):
 class BaseLRUTableManager(BaseTableManager[_DataT]):
     """Base class for LRU table managers."""
 
-    def __init__(self, recorder: "Recorder", lru_size: int) -> None:
+    def __init__(
+        self, recorder: "Recorder", lru_size: int, lru_size_limit: int | None = None
+    ) -> None:
         """Initialize the LRU table manager.
 
         We keep track of the most recently used items
         and evict the least recently used items when the cache is full.
+        If items are evicted, the cache grows at the next adjustment
+        until it reaches lru_size_limit.
         """
         super().__init__(recorder)
-        self._id_map = LRU(lru_size)
+        self._id_map = LRU(lru_size, callback=self._evicted)
+        self._lru_size_limit = lru_size_limit or lru_size
+        self._evictions = 0
+        self._evictions_since_adjust = 0
+
+    def _evicted(self, key: str, value: int) -> None:
+        """Count an entry evicted from the LRU."""
+        self._evictions += 1
+        self._evictions_since_adjust += 1
 
     def adjust_lru_size(self, new_size: int) -> None:
         """Adjust the LRU cache size.
 
+        The cache never shrinks. It grows to new_size, or beyond it
+        when entries were evicted since the last adjustment, which means
+        the working set does not fit.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
         lru = self._id_map
-        if new_size > lru.get_size():
+        current_size = lru.get_size()
+        if self._evictions_since_adjust:
+            self._evictions_since_adjust = 0
+            new_size = max(
+                new_size,
+                min(int(current_size * LRU_GROWTH_FACTOR), self._lru_size_limit),
+            )
+        if new_size > current_size:
             lru.set_size(new_size)
+
+    def cache_info(self) -> dict[str, Any]:
+        """Return the LRU cache metrics."""
+        lru = self._id_map
+        hits, misses = lru.get_stats()
+        return {
+            "size": lru.get_size(),
+            "entries": len(lru),
+            "hits": hits,
+            "misses": misses,
+            "evictions": self._evictions,
+        }
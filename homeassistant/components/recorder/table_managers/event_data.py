@@ -20,6 +20,8 @@ if TYPE_CHECKING:
 
 
 CACHE_SIZE = 2048
+# The largest size the cache may grow to when its working set does not fit
+CACHE_SIZE_LIMIT = 8192
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,7 +31,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, CACHE_SIZE_LIMIT)
         self.active = True  # always active
 
     def serialize_from_event(self, event: Event) -> bytes | None:
@@ -20,6 +20,8 @@ if TYPE_CHECKING:
 
 
 CACHE_SIZE = 2048
+# The largest size the cache may grow to when its working set does not fit
+CACHE_SIZE_LIMIT = 8192
 
 
 class EventTypeManager(BaseLRUTableManager[EventTypes]):
@@ -27,7 +29,7 @@ class EventTypeManager(BaseLRUTableManager[EventTypes]):
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, CACHE_SIZE_LIMIT)
         self._non_existent_event_types: LRU[str, None] = LRU(CACHE_SIZE)
 
     def load(self, events: list[Event], session: Session) -> None:
@@ -3,12 +3,13 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.orm.session import Session
 
-from homeassistant.core import Event
+from homeassistant.core import Event, State
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
@@ -25,6 +26,8 @@ if TYPE_CHECKING:
 # - How frequently states with overlapping attributes will change
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
+# The largest size the cache may grow to when its working set does not fit
+CACHE_SIZE_LIMIT = 16384
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,13 +37,33 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, CACHE_SIZE_LIMIT)
         self.active = True  # always active
+        # The last serialized attributes per entity_id. The state machine
+        # reuses the attributes of the previous state when they did not
+        # change, which lets us skip encoding them again as long as the
+        # attributes excluded from recording did not change either.
+        self._serialized: dict[
+            str, tuple[ReadOnlyDict[str, Any], frozenset[str] | None, bytes]
+        ] = {}
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
+        state: State | None = event.data.get("new_state")
+        unrecorded_attributes: frozenset[str] | None = None
+        if state is None:
+            self._serialized.pop(event.data["entity_id"], None)
+        else:
+            if state_info := state.state_info:
+                unrecorded_attributes = state_info["unrecorded_attributes"]
+            if (
+                (serialized := self._serialized.get(state.entity_id))
+                and serialized[0] is state.attributes
+                and serialized[1] == unrecorded_attributes
+            ):
+                return serialized[2]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -50,6 +73,13 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if state is not None:
+            self._serialized[state.entity_id] = (
+                state.attributes,
+                unrecorded_attributes,
+                shared_attrs_bytes,
+            )
+        return shared_attrs_bytes
 
     def load(self, events: list[Event], session: Session) -> None:
         """Load the shared_attrs to attributes_ids mapping into memory from events.
@@ -149,3 +179,12 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._serialized.clear()
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
     from ..core import Recorder
 
 CACHE_SIZE = 8192
+# The largest size the cache may grow to when its working set does not fit
+CACHE_SIZE_LIMIT = 32768
 
 
 class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
@@ -25,7 +27,7 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the states meta manager."""
         self._did_first_load = False
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, CACHE_SIZE_LIMIT)
 
     def load(self, events: list[Event], session: Session) -> None:
         """Load the entity_id to metadata_id mapping into memory.
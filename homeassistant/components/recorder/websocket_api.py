@@ -500,6 +500,12 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        caches = {
+            "event_data": instance.event_data_manager.cache_info(),
+            "event_types": instance.event_type_manager.cache_info(),
+            "state_attributes": instance.state_attributes_manager.cache_info(),
+            "states_meta": instance.states_meta_manager.cache_info(),
+        }
     else:
         backlog = None
         migration_in_progress = False
@@ -507,9 +513,11 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        caches = {}
 
     recorder_info = {
         "backlog": backlog,
+        "caches": caches,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
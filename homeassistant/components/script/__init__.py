@@ -11,6 +11,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import TraceLevel
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -52,7 +53,7 @@ from homeassistant.helpers.script import (
     script_stack_cv,
 )
 from homeassistant.helpers.service import async_set_service_schema
-from homeassistant.helpers.trace import trace_get, trace_path
+from homeassistant.helpers.trace import trace_disable, trace_get, trace_path
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.dt import parse_datetime
@@ -342,15 +343,24 @@ async def _async_process_config(
         """
         script_matches: set[int] = set()
         config_matches: set[int] = set()
+        script_configs_by_key: dict[str, list[tuple[int, ScriptEntityConfig]]] = {}
+
+        for config_idx, config in enumerate(script_configs):
+            script_configs_by_key.setdefault(config.key, []).append(
+                (config_idx, config)
+            )
 
         for script_idx, script in enumerate(scripts):
-            for config_idx, config in enumerate(script_configs):
-                if config_idx in config_matches:
-                    # Only allow a script config to match at most once
-                    continue
+            # Configurations can only match scripts with the same key
+            if script.unique_id is None:
+                continue
+            candidates = script_configs_by_key.get(script.unique_id, [])
+            for candidate_idx, (config_idx, config) in enumerate(candidates):
                 if script_matches_config(script, config):
                     script_matches.add(script_idx)
                     config_matches.add(config_idx)
+                    # Only allow a script config to match at most once
+                    del candidates[candidate_idx]
                     # Only allow a script to match at most once
                     break
 
@@ -590,8 +600,11 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             context,
             self._trace_config,
         ) as script_trace:
-            # Prepare tracing the execution of the script's sequence
-            script_trace.set_trace(trace_get())
+            if script_trace.level == TraceLevel.OFF:
+                trace_disable()
+            else:
+                # Prepare tracing the execution of the script's sequence
+                script_trace.set_trace(trace_get())
             with trace_path("sequence"):
                 this = None
                 if state := self.hass.states.get(self.entity_id):
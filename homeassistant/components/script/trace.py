@@ -8,6 +8,8 @@ from typing import Any
 from homeassistant.components.trace import (
     CONF_STORED_TRACES,
     ActionTrace,
+    TraceLevel,
+    async_get_run_trace_level,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
@@ -32,7 +34,9 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    trace.level = level = async_get_run_trace_level(trace_config)
+    if level == TraceLevel.FULL:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
 
     try:
         yield trace
@@ -43,3 +47,5 @@ def trace_script(
     finally:
         if item_id:
             trace.finished()
+        if level == TraceLevel.ERRORS and trace.failed:
+            async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
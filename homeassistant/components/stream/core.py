@@ -76,8 +76,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view into the segment data once it is joined
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -101,6 +101,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Joined data of all parts, only set once the segment is complete
+    _data: bytes | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -138,8 +140,24 @@ class Segment:
             output.part_put()
 
     def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+        """Return reconstructed data for all parts as bytes, without init.
+
+        The parts of a complete segment are joined only once. The parts are
+        then replaced by views into the joined data so that serving either
+        the segment or its parts does not copy or duplicate any bytes.
+        """
+        if self._data is not None:
+            return self._data
+        data = b"".join([part.data for part in self.parts])
+        if self.complete:
+            self._data = data
+            view = memoryview(data)
+            offset = 0
+            for part in self.parts:
+                end = offset + len(part.data)
+                part.data = view[offset:end]
+                offset = end
+        return data
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
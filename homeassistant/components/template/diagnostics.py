@@ -0,0 +1,33 @@
+"""Diagnostics support for Template."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .template_entity import async_get_template_dependents, async_get_template_listeners
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    listeners = async_get_template_listeners(hass)
+    entity_registry = er.async_get(hass)
+    entities: dict[str, Any] = {}
+    for entity_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        entity_id = entity_entry.entity_id
+        if (entity_listeners := listeners.get(entity_id)) is None:
+            continue
+        entities[entity_id] = {
+            key: sorted(value) if isinstance(value, set) else value
+            for key, value in entity_listeners.items()
+        }
+        entities[entity_id]["template_dependents"] = async_get_template_dependents(
+            hass, entity_id
+        )
+    return {"options": dict(entry.options), "entities": entities}
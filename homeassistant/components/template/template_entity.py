@@ -23,11 +23,13 @@ from homeassistant.core import (
     HomeAssistant,
     State,
     callback,
+    split_entity_id,
     validate_state,
 )
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.helpers.event import (
     EventStateChangedData,
     TrackTemplate,
@@ -54,6 +56,7 @@ from .const import (
     CONF_AVAILABILITY,
     CONF_AVAILABILITY_TEMPLATE,
     CONF_PICTURE,
+    DOMAIN,
 )
 
 if TYPE_CHECKING:
@@ -244,6 +247,45 @@ class _TemplateAttribute:
         return
 
 
+@callback
+def async_get_template_listeners(
+    hass: HomeAssistant,
+) -> dict[str, dict[str, bool | set[str]]]:
+    """Return the state changes that re-render each template entity."""
+    return {
+        entity.entity_id: listeners
+        for platform in async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+        if isinstance(entity, TemplateEntity)
+        and (listeners := entity.template_listeners) is not None
+    }
+
+
+def _listeners_match(listeners: dict[str, bool | set[str]], entity_id: str) -> bool:
+    """Return if a state change of entity_id triggers the listeners."""
+    if listeners["all"] is True:
+        return True
+    if isinstance(entities := listeners["entities"], set) and entity_id in entities:
+        return True
+    return (
+        isinstance(domains := listeners["domains"], set)
+        and split_entity_id(entity_id)[0] in domains
+    )
+
+
+@callback
+def async_get_template_dependents(hass: HomeAssistant, entity_id: str) -> list[str]:
+    """Return the template entities re-rendered by state changes of entity_id.
+
+    Entities, domains and all states listeners are taken into account.
+    """
+    return sorted(
+        dependent_id
+        for dependent_id, listeners in async_get_template_listeners(hass).items()
+        if dependent_id != entity_id and _listeners_match(listeners, entity_id)
+    )
+
+
 class TemplateEntity(Entity):
     """Entity that uses templates to calculate attributes."""
 
@@ -544,6 +586,13 @@ class TemplateEntity(Entity):
 
         async_at_start(self.hass, self._async_template_startup)
 
+    @property
+    def template_listeners(self) -> dict[str, bool | set[str]] | None:
+        """Return the state changes that re-render the templates."""
+        if self._template_result_info is None:
+            return None
+        return self._template_result_info.listeners
+
     async def async_update(self) -> None:
         """Call for forced update."""
         assert self._template_result_info
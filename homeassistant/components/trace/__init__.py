@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 import logging
+import random
 from typing import Any
 
 import voluptuous as vol
@@ -18,11 +19,15 @@ from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_LEVEL,
+    CONF_SAMPLE_RATE,
     CONF_STORED_TRACES,
     DATA_TRACE,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_RATE,
     DEFAULT_STORED_TRACES,
+    TraceLevel,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -34,7 +39,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_LEVEL, default=TraceLevel.FULL): vol.Coerce(TraceLevel),
+    vol.Optional(CONF_SAMPLE_RATE, default=DEFAULT_SAMPLE_RATE): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=1)
+    ),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -138,6 +147,21 @@ async def async_list_traces(
     return traces
 
 
+def async_get_run_trace_level(trace_config: ConfigType) -> TraceLevel:
+    """Return the trace level of a single run.
+
+    At the sampled level, a share of the runs is traced in full and the
+    other runs are not traced at all.
+    """
+    level: TraceLevel = trace_config[CONF_LEVEL]
+    if level != TraceLevel.SAMPLED:
+        return level
+    if random.random() < trace_config[CONF_SAMPLE_RATE]:
+        return TraceLevel.FULL
+    return TraceLevel.OFF
+
+
+@callback
 def async_store_trace(
     hass: HomeAssistant, trace: ActionTrace, stored_traces: int
 ) -> None:
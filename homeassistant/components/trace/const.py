@@ -1,7 +1,20 @@
 """Shared constants for script and automation tracing and debugging."""
+from enum import StrEnum
 
+CONF_LEVEL = "level"
+CONF_SAMPLE_RATE = "sample_rate"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
+DEFAULT_SAMPLE_RATE = 0.1  # Share of runs traced at the sampled level
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+
+
+class TraceLevel(StrEnum):
+    """Which runs of a script or automation are traced."""
+
+    FULL = "full"  # Trace and store every run
+    SAMPLED = "sampled"  # Trace and store a random share of the runs
+    ERRORS = "errors"  # Trace every run, only store failed or aborted runs
+    OFF = "off"  # Do not trace
@@ -17,6 +17,8 @@ from homeassistant.helpers.trace import (
 import homeassistant.util.dt as dt_util
 import homeassistant.util.uuid as uuid_util
 
+from .const import TraceLevel
+
 
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
@@ -61,6 +63,7 @@ class ActionTrace(BaseTrace):
         self._error: Exception | None = None
         self._state: str = "running"
         self._script_execution: str | None = None
+        self.level = TraceLevel.FULL
         self.run_id: str = uuid_util.random_uuid_hex()
         self._timestamp_finish: dt.datetime | None = None
         self._timestamp_start: dt.datetime = dt_util.utcnow()
@@ -79,6 +82,22 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    @property
+    def failed(self) -> bool:
+        """Return if the run failed or was aborted.
+
+        Runs which were not finished take the script execution result
+        from the current context.
+        """
+        script_execution = self._script_execution or script_execution_get()
+        return self._error is not None or script_execution in (
+            "aborted",
+            "disallowed_recursion_detected",
+            "error",
+            "failed_max_runs",
+            "failed_single",
+        )
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
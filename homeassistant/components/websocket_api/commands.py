@@ -55,7 +55,12 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
+    async_get_loaded_integrations,
+    async_get_setup_critical_path,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -82,6 +87,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_timeline)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -549,6 +555,32 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_timeline"})
+def handle_integration_setup_timeline(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration setup timeline command."""
+    timeline: dict[str, tuple[float, float]] = hass.data.get(DATA_SETUP_TIMELINE, {})
+    first_started = min((started for started, _ in timeline.values()), default=0)
+    connection.send_result(
+        msg["id"],
+        {
+            "integrations": [
+                {
+                    "domain": integration,
+                    "start": started - first_started,
+                    "seconds": finished - started,
+                }
+                for integration, (started, finished) in sorted(
+                    timeline.items(), key=lambda item: item[1]
+                )
+            ],
+            "critical_path": async_get_setup_critical_path(hass),
+        },
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 import contextlib
 from contextlib import suppress
 from dataclasses import dataclass
@@ -11,6 +12,7 @@ from ipaddress import IPv4Address, IPv6Address
 import logging
 import re
 import sys
+import time
 from typing import TYPE_CHECKING, Any, Final, cast
 
 import voluptuous as vol
@@ -29,6 +31,7 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import BaseServiceInfo
 from homeassistant.helpers import discovery_flow, instance_id
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import (
@@ -72,6 +75,10 @@ MAX_PROPERTY_VALUE_LEN = 230
 # Dns label max length
 MAX_NAME_LEN = 63
 
+# How long an unchanged service info is not discovered again. Flows that were
+# aborted or ignored are started again once it expires.
+UNCHANGED_SERVICE_INFO_TTL = 300
+
 ATTR_DOMAIN: Final = "domain"
 ATTR_NAME: Final = "name"
 ATTR_PROPERTIES: Final = "properties"
@@ -357,6 +364,10 @@ class ZeroconfDiscovery:
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
         self.async_service_browser: AsyncServiceBrowser | None = None
+        # The last processed service info by name and when it was processed,
+        # used to skip updates that would discover exactly the same device again
+        self._service_infos: dict[str, tuple[ZeroconfServiceInfo, float]] = {}
+        self._unsub_config_entry_changed: Callable[[], None] | None = None
 
     async def async_setup(self) -> None:
         """Start discovery."""
@@ -368,15 +379,33 @@ class ZeroconfDiscovery:
             if hk_type not in self.zeroconf_types:
                 types.append(hk_type)
         _LOGGER.debug("Starting Zeroconf browser for: %s", types)
+        self._unsub_config_entry_changed = async_dispatcher_connect(
+            self.hass,
+            config_entries.SIGNAL_CONFIG_ENTRY_CHANGED,
+            self._async_config_entry_changed,
+        )
         self.async_service_browser = AsyncServiceBrowser(
             self.zeroconf, types, handlers=[self.async_service_update]
         )
 
     async def async_stop(self) -> None:
         """Cancel the service browser and stop processing the queue."""
+        if self._unsub_config_entry_changed:
+            self._unsub_config_entry_changed()
+            self._unsub_config_entry_changed = None
         if self.async_service_browser:
             await self.async_service_browser.async_cancel()
 
+    @callback
+    def _async_config_entry_changed(
+        self,
+        change: config_entries.ConfigEntryChange,
+        entry: config_entries.ConfigEntry,
+    ) -> None:
+        """Allow devices to be discovered again when a config entry is removed."""
+        if change == config_entries.ConfigEntryChange.REMOVED:
+            self._service_infos.clear()
+
     def _async_dismiss_discoveries(self, name: str) -> None:
         """Dismiss all discoveries for the given name."""
         for flow in self.hass.config_entries.flow.async_progress_by_init_data_type(
@@ -402,6 +431,7 @@ class ZeroconfDiscovery:
         )
 
         if state_change == ServiceStateChange.Removed:
+            self._service_infos.pop(name, None)
             self._async_dismiss_discoveries(name)
             return
 
@@ -443,6 +473,17 @@ class ZeroconfDiscovery:
             # Prevent the browser thread from collapsing
             _LOGGER.debug("Failed to get addresses for device %s", name)
             return
+        now = time.monotonic()
+        if (
+            (last := self._service_infos.get(name)) is not None
+            and last[0] == info
+            and now - last[1] < UNCHANGED_SERVICE_INFO_TTL
+        ):
+            # If the device was recently discovered with the same info,
+            # do not trigger a config flow again
+            _LOGGER.debug("Ignoring unchanged update for device %s", name)
+            return
+        self._service_infos[name] = (info, now)
         _LOGGER.debug("Discovered new device %s %s", name, info)
         props: dict[str, str | None] = info.properties
         domain = None
@@ -66,7 +66,13 @@ from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml import (
+    SECRET_YAML,
+    Secrets,
+    YamlFileCache,
+    YamlTypeError,
+    load_yaml_dict,
+)
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -77,6 +83,7 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_YAML_CACHE = "hass_yaml_cache"
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
@@ -467,12 +474,15 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     configuration by itself. Include package merge.
     """
     secrets = Secrets(Path(hass.config.config_dir))
+    if (cache := hass.data.get(DATA_YAML_CACHE)) is None:
+        cache = hass.data[DATA_YAML_CACHE] = YamlFileCache()
 
     # Not using async_add_executor_job because this is an internal method.
     try:
         config = await hass.loop.run_in_executor(
             None,
-            load_yaml_config_file,
+            _load_yaml_config_file_cached,
+            cache,
             hass.config.path(YAML_CONFIG_FILE),
             secrets,
         )
@@ -540,6 +550,14 @@ def load_yaml_config_file(
     return conf_dict
 
 
+def _load_yaml_config_file_cached(
+    cache: YamlFileCache, config_path: str, secrets: Secrets
+) -> dict[Any, Any]:
+    """Parse a YAML configuration file, reusing unchanged included files."""
+    with cache.activate():
+        return load_yaml_config_file(config_path, secrets)
+
+
 def process_ha_config_upgrade(hass: HomeAssistant) -> None:
     """Upgrade configuration if necessary.
 
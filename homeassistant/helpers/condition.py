@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from collections.abc import Callable, Container, Generator
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, time as dt_time, timedelta
 import functools as ft
 import re
@@ -63,6 +63,7 @@ from .template import Template, attach as template_attach, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -90,6 +91,9 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Used in place of trace contexts when there is no active trace
+_NO_TRACE = nullcontext()
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -170,11 +174,16 @@ def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement, None
 
 
 def trace_condition_function(condition: ConditionCheckerType) -> ConditionCheckerType:
-    """Wrap a condition function to enable basic tracing."""
+    """Wrap a condition function to enable basic tracing.
+
+    Tracing is skipped when the condition is not evaluated as part of a trace.
+    """
 
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if trace_cv.get() is None:
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -183,6 +192,15 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     return wrapper
 
 
+@contextmanager
+def _trace_entity_condition(
+    index: int, variables: TemplateVarsType
+) -> Generator[None, None, None]:
+    """Trace the check of a single entity of a condition."""
+    with trace_path(["entity_id", str(index)]), trace_condition(variables):
+        yield
+
+
 async def _async_get_condition_platform(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionProtocol | None:
@@ -252,6 +270,7 @@ async def async_and_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    paths = [["conditions", str(index)] for index in range(len(checks))]
 
     @trace_condition_function
     def if_and_condition(
@@ -259,9 +278,10 @@ async def async_and_from_config(
     ) -> bool:
         """Test and condition."""
         errors = []
+        tracing = trace_cv.get() is not None
         for index, check in enumerate(checks):
             try:
-                with trace_path(["conditions", str(index)]):
+                with trace_path(paths[index]) if tracing else _NO_TRACE:
                     if check(hass, variables) is False:
                         return False
             except ConditionError as ex:
@@ -283,6 +303,7 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    paths = [["conditions", str(index)] for index in range(len(checks))]
 
     @trace_condition_function
     def if_or_condition(
@@ -290,9 +311,10 @@ async def async_or_from_config(
     ) -> bool:
         """Test or condition."""
         errors = []
+        tracing = trace_cv.get() is not None
         for index, check in enumerate(checks):
             try:
-                with trace_path(["conditions", str(index)]):
+                with trace_path(paths[index]) if tracing else _NO_TRACE:
                     if check(hass, variables) is True:
                         return True
             except ConditionError as ex:
@@ -314,6 +336,7 @@ async def async_not_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    paths = [["conditions", str(index)] for index in range(len(checks))]
 
     @trace_condition_function
     def if_not_condition(
@@ -321,9 +344,10 @@ async def async_not_from_config(
     ) -> bool:
         """Test not condition."""
         errors = []
+        tracing = trace_cv.get() is not None
         for index, check in enumerate(checks):
             try:
-                with trace_path(["conditions", str(index)]):
+                with trace_path(paths[index]) if tracing else _NO_TRACE:
                     if check(hass, variables):
                         return False
             except ConditionError as ex:
@@ -504,9 +528,12 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
             value_template.hass = hass
 
         errors = []
+        tracing = trace_cv.get() is not None
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
+                with (
+                    _trace_entity_condition(index, variables) if tracing else _NO_TRACE
+                ):
                     if not async_numeric_state(
                         hass,
                         entity_id,
@@ -623,9 +650,12 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
         template_attach(hass, for_period)
         errors = []
         result: bool = match != ENTITY_MATCH_ANY
+        tracing = trace_cv.get() is not None
         for index, entity_id in enumerate(entity_ids):
             try:
-                with trace_path(["entity_id", str(index)]), trace_condition(variables):
+                with (
+                    _trace_entity_condition(index, variables) if tracing else _NO_TRACE
+                ):
                     if state(
                         hass, entity_id, req_states, for_period, attribute, variables
                     ):
@@ -7,7 +7,7 @@ from functools import partial
 import logging
 from typing import Any, Generic, TypeVarTuple, overload
 
-from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.core import HassJob, HassJobType, HomeAssistant, callback
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.logging import catch_log_exception
@@ -16,6 +16,7 @@ _Ts = TypeVarTuple("_Ts")
 
 _LOGGER = logging.getLogger(__name__)
 DATA_DISPATCHER = "dispatcher"
+DATA_DISPATCHER_JOBS = "dispatcher_jobs"
 
 
 @dataclass(frozen=True)
@@ -46,6 +47,12 @@ _DispatcherDataType = dict[
         HassJob[..., None | Coroutine[Any, Any, None]] | None,
     ],
 ]
+# The jobs to run for each signal, built on the first send after
+# a target was connected or removed
+_DispatcherJobsType = dict[
+    SignalType[*_Ts] | str,
+    tuple[HassJob[..., None | Coroutine[Any, Any, None]], ...],
+]
 
 
 @overload
@@ -85,10 +92,12 @@ def dispatcher_connect(
 @callback
 def _async_remove_dispatcher(
     dispatchers: _DispatcherDataType[*_Ts],
+    jobs: _DispatcherJobsType[*_Ts],
     signal: SignalType[*_Ts] | str,
     target: Callable[[*_Ts], Any] | Callable[..., Any],
 ) -> None:
     """Remove signal listener."""
+    jobs.pop(signal, None)
     try:
         signal_dispatchers = dispatchers[signal]
         del signal_dispatchers[target]
@@ -133,18 +142,21 @@ def async_dispatcher_connect(
     """
     if DATA_DISPATCHER not in hass.data:
         hass.data[DATA_DISPATCHER] = {}
+        hass.data[DATA_DISPATCHER_JOBS] = {}
 
     dispatchers: _DispatcherDataType[*_Ts] = hass.data[DATA_DISPATCHER]
+    jobs: _DispatcherJobsType[*_Ts] = hass.data[DATA_DISPATCHER_JOBS]
 
     if signal not in dispatchers:
         dispatchers[signal] = {}
 
     dispatchers[signal][target] = None
+    jobs.pop(signal, None)
     # Use a partial for the remove since it uses
     # less memory than a full closure since a partial copies
     # the body of the function and we don't have to store
     # many different copies of the same function
-    return partial(_async_remove_dispatcher, dispatchers, signal, target)
+    return partial(_async_remove_dispatcher, dispatchers, jobs, signal, target)
 
 
 @overload
@@ -214,14 +226,32 @@ def async_dispatcher_send(
 
     This method must be run in the event loop.
     """
-    if (maybe_dispatchers := hass.data.get(DATA_DISPATCHER)) is None:
-        return
-    dispatchers: _DispatcherDataType[*_Ts] = maybe_dispatchers
-    if (target_list := dispatchers.get(signal)) is None:
+    if (maybe_jobs := hass.data.get(DATA_DISPATCHER_JOBS)) is None:
         return
+    jobs: _DispatcherJobsType[*_Ts] = maybe_jobs
+    if (signal_jobs := jobs.get(signal)) is None:
+        if (signal_jobs := _async_build_jobs(hass, signal)) is None:
+            return
+        jobs[signal] = signal_jobs
+
+    for job in signal_jobs:
+        # Callbacks are run inline, the same as
+        # async_run_hass_job would, without the extra call
+        if job.job_type is HassJobType.Callback:
+            job.target(*args)
+        else:
+            hass.async_add_hass_job(job, *args)
 
-    for target, job in list(target_list.items()):
+
+@callback
+def _async_build_jobs(
+    hass: HomeAssistant, signal: SignalType[*_Ts] | str
+) -> tuple[HassJob[..., None | Coroutine[Any, Any, None]], ...] | None:
+    """Build the jobs to run when a signal is sent."""
+    dispatchers: _DispatcherDataType[*_Ts] = hass.data[DATA_DISPATCHER]
+    if (target_list := dispatchers.get(signal)) is None:
+        return None
+    for target, job in target_list.items():
         if job is None:
-            job = _generate_job(signal, target)
-            target_list[target] = job
-        hass.async_run_hass_job(job, *args)
+            target_list[target] = _generate_job(signal, target)
+    return tuple(job for job in target_list.values() if job is not None)
@@ -4,11 +4,11 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import functools as ft
 import logging
-from random import randint
+from random import randrange
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypedDict, TypeVar
 
@@ -63,6 +63,8 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+TRACK_UTC_TIME_CHANGE_GROUPS = "track_utc_time_change_groups"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -75,6 +77,9 @@ _LOGGER = logging.getLogger(__name__)
 # in PR https://github.com/home-assistant/core/pull/82233
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
+# async_track_utc_time_change listeners with the same pattern share a timer
+# per slot of this many microseconds instead of each scheduling their own
+TIME_CHANGE_SLOT_MICROSECONDS = 50000
 
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _P = ParamSpec("_P")
@@ -1703,14 +1708,24 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+_TimeChangeGroupKey = tuple[
+    tuple[int, ...], tuple[int, ...], tuple[int, ...], int, bool
+]
+
+
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
+    """Fire all jobs tracking the same time pattern from one timer."""
+
     hass: HomeAssistant
+    key: _TimeChangeGroupKey
     time_match_expression: tuple[list[int], list[int], list[int]]
     microsecond: int
     local: bool
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
+    jobs: dict[HassJob[[datetime], Coroutine[Any, Any, None] | None], None] = field(
+        default_factory=dict
+    )
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
 
@@ -1742,7 +1757,15 @@ class _TrackUTCTimeChange:
         # time when the timer was scheduled
         utc_now = time_tracker_utcnow()
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        hass.async_run_hass_job(self.job, localized_now)
+        for job in list(self.jobs):
+            # A failing job must not stop the timer shared with other jobs
+            try:
+                hass.async_run_hass_job(job, localized_now)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running job %s", job)
+        if not self.jobs:
+            # All jobs were removed while running
+            return
         if TYPE_CHECKING:
             assert self._pattern_time_change_listener_job is not None
         self._cancel_callback = async_track_point_in_utc_time(
@@ -1751,12 +1774,31 @@ class _TrackUTCTimeChange:
             self._calculate_next(utc_now + timedelta(seconds=1)),
         )
 
+    @callback
+    def async_add_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> CALLBACK_TYPE:
+        """Add a job and return a callback to remove it."""
+        self.jobs[job] = None
+
+        @callback
+        def _async_remove_job() -> None:
+            """Remove the job and cancel the timer when no jobs are left."""
+            if self.jobs.pop(job, False) is None and not self.jobs:
+                self.async_cancel()
+
+        return _async_remove_job
+
     @callback
     def async_cancel(self) -> None:
         """Cancel the call_at."""
         if TYPE_CHECKING:
             assert self._cancel_callback is not None
         self._cancel_callback()
+        groups: dict[_TimeChangeGroupKey, _TrackUTCTimeChange]
+        groups = self.hass.data[TRACK_UTC_TIME_CHANGE_GROUPS]
+        if groups.get(self.key) is self:
+            del groups[self.key]
 
 
 @callback
@@ -1790,18 +1832,31 @@ def async_track_utc_time_change(
     # Avoid aligning all time trackers to the same fraction of a second
     # since it can create a thundering herd problem
     # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
-    track = _TrackUTCTimeChange(
-        hass,
-        (matching_seconds, matching_minutes, matching_hours),
+    # Listeners with the same pattern that land in the same slot share
+    # a single timer and next fire time calculation.
+    microsecond = randrange(
+        RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX, TIME_CHANGE_SLOT_MICROSECONDS
+    )
+    key: _TimeChangeGroupKey = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
         microsecond,
         local,
-        job,
-        listener_job_name,
     )
-    track.async_attach()
-    return track.async_cancel
+    groups: dict[_TimeChangeGroupKey, _TrackUTCTimeChange]
+    groups = hass.data.setdefault(TRACK_UTC_TIME_CHANGE_GROUPS, {})
+    if (track := groups.get(key)) is None:
+        track = groups[key] = _TrackUTCTimeChange(
+            hass,
+            key,
+            (matching_seconds, matching_minutes, matching_hours),
+            microsecond,
+            local,
+            f"time change listener {hour}:{minute}:{second} local={local}",
+        )
+        track.async_attach()
+    return track.async_add_job(job)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -1884,11 +1939,22 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
 
     if info.filter(entity_id):
-        return True
+        # A template that only reads states can not change
+        # when only the attributes of an entity changed
+        return (
+            info.has_attributes
+            or info.exception is not None
+            or old_state is None
+            or new_state is None
+            or old_state.state != new_state.state
+            or old_state.last_changed != new_state.last_changed
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
@@ -87,6 +87,7 @@ from .trace import (
     async_trace_path,
     script_execution_set,
     trace_append_element,
+    trace_cv,
     trace_id_get,
     trace_path,
     trace_path_get,
@@ -169,11 +170,14 @@ async def trace_action(
     script_run: _ScriptRun,
     stop: asyncio.Event,
     variables: dict[str, Any],
-) -> AsyncGenerator[TraceElement, None]:
+) -> AsyncGenerator[TraceElement | None, None]:
     """Trace action execution."""
     path = trace_path_get()
-    trace_element = action_trace_append(variables, path)
-    trace_stack_push(trace_stack_cv, trace_element)
+    trace_element = None
+    # Only record the step when tracing is enabled, breakpoints still apply
+    if trace_cv.get() is not None:
+        trace_element = action_trace_append(variables, path)
+        trace_stack_push(trace_stack_cv, trace_element)
 
     trace_id = trace_id_get()
     if trace_id:
@@ -219,6 +223,10 @@ async def trace_action(
             remove_signal1()
             remove_signal2()
 
+    if trace_element is None:
+        yield None
+        return
+
     try:
         yield trace_element
     except _AbortScript as ex:
@@ -488,7 +496,8 @@ class _ScriptRun:
                         ex, continue_on_error, self._log_exceptions or log_exceptions
                     )
                 finally:
-                    trace_element.update_variables(self._variables)
+                    if trace_element is not None:
+                        trace_element.update_variables(self._variables)
 
     def _finish(self) -> None:
         self._script._runs.remove(self)  # pylint: disable=protected-access
@@ -488,10 +488,11 @@ def async_extract_referenced_entity_ids(
     # Find devices for targeted areas
     selected.referenced_devices.update(selector.device_ids)
 
-    if selector.area_ids:
-        for device_entry in dev_reg.devices.values():
-            if device_entry.area_id in selector.area_ids:
-                selected.referenced_devices.add(device_entry.id)
+    selected.referenced_devices.update(
+        device_entry.id
+        for area_id in selector.area_ids
+        for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
+    )
 
     if not selector.area_ids and not selected.referenced_devices:
         return selected
@@ -5,7 +5,7 @@ from ast import literal_eval
 import asyncio
 import base64
 import collections.abc
-from collections.abc import Callable, Generator, Iterable
+from collections.abc import Callable, Collection, Generator, Iterable
 from contextlib import AbstractContextManager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
@@ -118,6 +118,13 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "object_id",
     "name",
 }
+# State object properties that only change together with the state itself
+_STATE_ONLY_ATTRIBUTES = {
+    "state",
+    "last_changed",
+    "domain",
+    "object_id",
+}
 
 _T = TypeVar("_T")
 _R = TypeVar("_R")
@@ -346,6 +353,7 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "has_attributes",
     )
 
     def __init__(self, template: Template) -> None:
@@ -364,6 +372,9 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
+        # Set when the template reads more than the state of an entity,
+        # for example its attributes or when it was last updated.
+        self.has_attributes = False
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -376,6 +387,7 @@ class RenderInfo:
             f" entities={self.entities}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
+            f" has_attributes={self.has_attributes}"
             f" exception={self.exception}"
             f" is_static={self.is_static}"
             ">"
@@ -989,14 +1001,21 @@ class TemplateStateBase(State):
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
+    def _collect_attributes(self) -> None:
+        if render_info := _render_info.get():
+            render_info.has_attributes = True
+
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            if render_info := _render_info.get():
+                if self._collect:
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                if item not in _STATE_ONLY_ATTRIBUTES:
+                    render_info.has_attributes = True
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1022,6 +1041,7 @@ class TemplateStateBase(State):
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
         self._collect_state()
+        self._collect_attributes()
         return self._state.attributes
 
     @property
@@ -1034,12 +1054,14 @@ class TemplateStateBase(State):
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
         self._collect_state()
+        self._collect_attributes()
         return self._state.last_updated
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
         self._collect_state()
+        self._collect_attributes()
         return self._state.context
 
     @property
@@ -1058,6 +1080,7 @@ class TemplateStateBase(State):
     def name(self) -> str:
         """Wrap State.name."""
         self._collect_state()
+        self._collect_attributes()
         return self._state.name
 
     @property
@@ -1075,6 +1098,7 @@ class TemplateStateBase(State):
         )
 
         self._collect_state()
+        self._collect_attributes()
         if rounded and self._state.domain == SENSOR_DOMAIN:
             state = async_rounded_state(self._hass, self._entity_id, self._state)
         else:
@@ -1083,9 +1107,74 @@ class TemplateStateBase(State):
             return f"{state} {unit}"
         return state
 
+    # The serialized forms of State are cached properties. Template states
+    # are shared between templates, so they are wrapped to collect on every
+    # access instead of only on the first one.
+    @property
+    def last_updated_timestamp(self) -> float:
+        """Wrap State.last_updated_timestamp."""
+        self._collect_state()
+        self._collect_attributes()
+        return self._state.last_updated_timestamp
+
+    @property
+    def last_changed_timestamp(self) -> float:
+        """Wrap State.last_changed_timestamp."""
+        self._collect_state()
+        return self._state.last_changed_timestamp
+
+    @property
+    def _as_dict(self) -> dict[str, Any]:
+        """Wrap State._as_dict."""
+        self._collect_state()
+        self._collect_attributes()
+        return self._state._as_dict  # pylint: disable=protected-access
+
+    def as_dict(self) -> ReadOnlyDict[str, datetime | Collection[Any]]:
+        """Wrap State.as_dict."""
+        self._collect_state()
+        self._collect_attributes()
+        return self._state.as_dict()
+
+    @property
+    def _as_read_only_dict(
+        self,
+    ) -> ReadOnlyDict[str, datetime | Collection[Any]]:
+        """Wrap State._as_read_only_dict."""
+        return self.as_dict()
+
+    @property
+    def as_dict_json(self) -> bytes:
+        """Wrap State.as_dict_json."""
+        self._collect_state()
+        self._collect_attributes()
+        return self._state.as_dict_json
+
+    @property
+    def json_fragment(self) -> orjson.Fragment:
+        """Wrap State.json_fragment."""
+        self._collect_state()
+        self._collect_attributes()
+        return self._state.json_fragment
+
+    @property
+    def as_compressed_state(self) -> dict[str, Any]:
+        """Wrap State.as_compressed_state."""
+        self._collect_state()
+        self._collect_attributes()
+        return self._state.as_compressed_state
+
+    @property
+    def as_compressed_state_json(self) -> bytes:
+        """Wrap State.as_compressed_state_json."""
+        self._collect_state()
+        self._collect_attributes()
+        return self._state.as_compressed_state_json
+
     def __eq__(self, other: Any) -> bool:
         """Ensure we collect on equality check."""
         self._collect_state()
+        self._collect_attributes()
         return self._state.__eq__(other)
 
 
@@ -1102,6 +1191,7 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_attributes()
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -207,6 +207,15 @@ def trace_clear() -> None:
     script_execution_cv.set(StopReason())
 
 
+def trace_disable() -> None:
+    """Disable tracing in the current context.
+
+    Steps are not recorded until a new trace is started with trace_get.
+    """
+    trace_clear()
+    trace_cv.set(None)
+
+
 def trace_set_child_id(child_key: str, child_run_id: str) -> None:
     """Set child trace_id of TraceElement at the top of the stack."""
     if node := trace_stack_top(trace_stack_cv):
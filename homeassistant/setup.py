@@ -59,6 +59,12 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_SETUP_TIMELINE is a dict [str, tuple[float, float]], indicating the
+# monotonic time setting up an integration, including its platforms, first
+# started and last finished during startup. Setups after Home Assistant
+# started, like reloads or setups during shutdown, are not recorded.
+DATA_SETUP_TIMELINE = "setup_timeline"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
@@ -584,11 +590,16 @@ def async_start_setup(
         unique = ensure_unique_string(domain, setup_started)
         unique_components[unique] = domain
         setup_started[unique] = started
+    during_startup = hass.state in (core.CoreState.not_running, core.CoreState.starting)
 
     yield
 
     setup_time: dict[str, float] = hass.data.setdefault(DATA_SETUP_TIME, {})
-    time_taken = time.monotonic() - started
+    timeline: dict[str, tuple[float, float]] | None = None
+    if during_startup:
+        timeline = hass.data.setdefault(DATA_SETUP_TIMELINE, {})
+    finished = time.monotonic()
+    time_taken = finished - started
     for unique, domain in unique_components.items():
         del setup_started[unique]
         integration = domain.partition(".")[0]
@@ -596,3 +607,46 @@ def async_start_setup(
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+        if timeline is None:
+            continue
+        if (span := timeline.get(integration)) is not None:
+            timeline[integration] = (min(span[0], started), max(span[1], finished))
+        else:
+            timeline[integration] = (started, finished)
+
+
+@core.callback
+def async_get_setup_critical_path(hass: core.HomeAssistant) -> list[str]:
+    """Return the chain of dependencies of the integration that finished last.
+
+    Each integration in the chain is the dependency that finished setting up
+    last before the next one could start, so the chain explains why startup
+    took as long as it did.
+    """
+    timeline: dict[str, tuple[float, float]] = hass.data.get(DATA_SETUP_TIMELINE, {})
+    if not timeline:
+        return []
+    domain = max(timeline, key=lambda domain: timeline[domain][1])
+    path = [domain]
+    while True:
+        try:
+            integration = loader.async_get_loaded_integration(hass, domain)
+        except loader.IntegrationNotLoaded:
+            break
+        started = timeline[domain][0]
+        dependencies = [
+            dependency
+            for dependency in (
+                *integration.dependencies,
+                *integration.after_dependencies,
+            )
+            if dependency in timeline
+            and dependency not in path
+            and timeline[dependency][0] <= started
+        ]
+        if not dependencies:
+            break
+        domain = max(dependencies, key=lambda domain: timeline[domain][1])
+        path.append(domain)
+    path.reverse()
+    return path
@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
-from contextlib import suppress
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import time
 from typing import Any, TextIO, TypeVar, overload
 
 import yaml
@@ -40,6 +43,138 @@ class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
 
 
+_FileSignature = tuple[int, int, int] | None
+
+# File systems record modification times with limited precision. Files
+# changed this recently could change again without a visible difference.
+_CACHE_MIN_AGE_NS = 2_000_000_000
+
+
+@dataclass(slots=True)
+class _CacheFrame:
+    """Dependencies collected while loading a single file."""
+
+    dependencies: dict[str, _FileSignature] = field(default_factory=dict)
+    cacheable: bool = True
+
+
+_active_cache: ContextVar[tuple[YamlFileCache, list[_CacheFrame]] | None] = ContextVar(
+    "yaml_file_cache", default=None
+)
+
+
+def _file_signature(path: str) -> _FileSignature:
+    """Return the signature used to detect changes to a file or directory."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy the mutable containers of a loaded YAML value.
+
+    Strings and other leaves are immutable and shared with the original.
+    """
+    if isinstance(value, dict):
+        new_value: Any = value.__class__(
+            (key, _copy_containers(item)) for key, item in value.items()
+        )
+    elif isinstance(value, list):
+        new_value = value.__class__(_copy_containers(item) for item in value)
+    else:
+        return value
+    if attributes := getattr(value, "__dict__", None):
+        new_value.__dict__.update(attributes)
+    return new_value
+
+
+class YamlFileCache:
+    """Keep parsed YAML files around between loads of the same configuration.
+
+    While activated, every file loaded with load_yaml is validated against
+    the inode, modification time and size of the file itself and of every
+    file and directory it included. Unchanged files are returned from the
+    cache instead of being parsed again. Files using !secret or !env_var,
+    directly or through an include, are always parsed again since their
+    content depends on more than the files on disk.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: dict[
+            str, tuple[dict[str, _FileSignature], JSON_TYPE | None]
+        ] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        """Use the cache for files loaded in the current context."""
+        token = _active_cache.set((self, []))
+        try:
+            yield
+        finally:
+            _active_cache.reset(token)
+
+    def clear(self) -> None:
+        """Drop all cached files."""
+        self._entries.clear()
+
+    def _load(
+        self, fname: str, secrets: Secrets | None, frames: list[_CacheFrame]
+    ) -> JSON_TYPE | None:
+        """Load a YAML file from the cache or parse it."""
+        parent = frames[-1] if frames else None
+        if (entry := self._entries.get(fname)) is not None:
+            dependencies, value = entry
+            if all(
+                _file_signature(path) == signature
+                for path, signature in dependencies.items()
+            ):
+                self.hits += 1
+                if parent is not None:
+                    parent.dependencies.update(dependencies)
+                return _copy_containers(value)
+            # Another executor thread may have evicted it already
+            self._entries.pop(fname, None)
+
+        self.misses += 1
+        frame = _CacheFrame()
+        # Take the signature before reading so a concurrent change is not missed
+        if (signature := _file_signature(fname)) is None:
+            frame.cacheable = False
+        frame.dependencies[fname] = signature
+        frames.append(frame)
+        try:
+            value = _load_yaml(fname, secrets)
+        finally:
+            frames.pop()
+        if parent is not None:
+            parent.dependencies.update(frame.dependencies)
+            parent.cacheable = parent.cacheable and frame.cacheable
+        settled = time.time_ns() - _CACHE_MIN_AGE_NS
+        if frame.cacheable and all(
+            signature is not None and signature[1] < settled
+            for signature in frame.dependencies.values()
+        ):
+            self._entries[fname] = (frame.dependencies, _copy_containers(value))
+        return value
+
+
+def _add_cache_dependency(path: str) -> None:
+    """Make the file being loaded depend on a file or directory."""
+    if (active := _active_cache.get()) is not None and active[1]:
+        active[1][-1].dependencies[path] = _file_signature(path)
+
+
+def _mark_uncacheable() -> None:
+    """Prevent the file being loaded from being cached."""
+    if (active := _active_cache.get()) is not None and active[1]:
+        active[1][-1].cacheable = False
+
+
 class Secrets:
     """Store secrets while loading YAML."""
 
@@ -219,6 +354,16 @@ def load_yaml(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> JSON_TYPE | None:
     """Load a YAML file."""
+    if (active := _active_cache.get()) is not None:
+        cache, frames = active
+        return cache._load(os.fspath(fname), secrets, frames)
+    return _load_yaml(fname, secrets)
+
+
+def _load_yaml(
+    fname: str | os.PathLike[str], secrets: Secrets | None = None
+) -> JSON_TYPE | None:
+    """Load a YAML file without using the file cache."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -343,7 +488,9 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    _add_cache_dependency(directory)
     for root, dirs, files in os.walk(directory, topdown=True):
+        _add_cache_dependency(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -470,6 +617,7 @@ def _handle_scalar_tag(
 
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    _mark_uncacheable()
     args = node.value.split()
 
     # Check for a default value
@@ -483,6 +631,7 @@ def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
 
 def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
+    _mark_uncacheable()
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
@@ -2,16 +2,18 @@
 import pytest
 import voluptuous as vol
 
+from homeassistant.auth import auth_store
 from homeassistant.auth.permissions.entities import (
     ENTITY_POLICY_SCHEMA,
     compile_entities,
 )
 from homeassistant.auth.permissions.models import PermissionLookup
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.entity_registry import RegistryEntry
 
-from tests.common import mock_device_registry, mock_registry
+from tests.common import MockConfigEntry, mock_device_registry, mock_registry
 
 
 def test_entities_none() -> None:
@@ -216,3 +218,36 @@ def test_entities_areas_area_true(hass: HomeAssistant) -> None:
     assert compiled("light.kitchen", "control") is True
     assert compiled("light.kitchen", "edit") is False
     assert compiled("switch.kitchen", "read") is False
+
+
+async def test_entities_areas_registry_updated(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test area and device lookups follow registry updates."""
+    store = auth_store.AuthStore(hass)
+    await store.async_load()
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("test", "device")},
+    )
+    entity_registry.async_get_or_create("light", "test", "1234", device_id=device.id)
+
+    policy = {"area_ids": {"kitchen": {"read": True}}}
+    compiled = compile_entities(policy, store._perm_lookup)
+    assert compiled("light.test_1234", "read") is False
+
+    device_registry.async_update_device(device.id, area_id="kitchen")
+    assert compiled("light.test_1234", "read") is True
+
+    entity_registry.async_update_entity(
+        "light.test_1234", new_entity_id="light.kitchen"
+    )
+    assert compiled("light.kitchen", "read") is True
+    assert compiled("light.test_1234", "read") is False
+
+    entity_registry.async_update_entity("light.kitchen", device_id=None)
+    assert compiled("light.kitchen", "read") is False
@@ -0,0 +1,203 @@
+"""Test image_cache module."""
+import asyncio
+import gc
+from unittest.mock import AsyncMock, patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components import camera
+from homeassistant.components.camera import Image
+from homeassistant.components.camera.image_cache import CameraImageCache
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+
+async def test_concurrent_fetches_are_coalesced(hass: HomeAssistant) -> None:
+    """Test concurrent requests for the same size share one fetch."""
+    cache = CameraImageCache()
+    release = asyncio.Event()
+    fetch_count = 0
+
+    async def _fetch() -> Image:
+        nonlocal fetch_count
+        fetch_count += 1
+        await release.wait()
+        return Image("image/jpeg", b"image")
+
+    tasks = [
+        asyncio.create_task(cache.async_get(hass, (None, None), _fetch))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    images = await asyncio.gather(*tasks)
+
+    assert fetch_count == 1
+    assert all(image.content == b"image" for image in images)
+    assert cache.as_dict() == {
+        "requests": 5,
+        "hits": 0,
+        "misses": 1,
+        "coalesced": 4,
+        "evictions": 0,
+        "hit_rate": 0.8,
+        "entries": 0,
+        "bytes": 0,
+    }
+
+
+async def test_ttl(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test images are served from cache until the ttl expires."""
+    cache = CameraImageCache()
+    fetch = AsyncMock(
+        side_effect=[Image("image/jpeg", b"1"), Image("image/jpeg", b"2")]
+    )
+
+    assert (await cache.async_get(hass, (640, 480), fetch, 10)).content == b"1"
+    assert (await cache.async_get(hass, (640, 480), fetch, 10)).content == b"1"
+    assert fetch.call_count == 1
+
+    freezer.tick(11)
+    assert (await cache.async_get(hass, (640, 480), fetch, 10)).content == b"2"
+    assert fetch.call_count == 2
+
+
+async def test_no_ttl_does_not_store(hass: HomeAssistant) -> None:
+    """Test nothing is kept when the ttl is zero."""
+    cache = CameraImageCache()
+    fetch = AsyncMock(return_value=Image("image/jpeg", b"image"))
+
+    await cache.async_get(hass, (None, None), fetch)
+    await cache.async_get(hass, (None, None), fetch)
+
+    assert fetch.call_count == 2
+    assert cache.as_dict()["entries"] == 0
+
+
+async def test_sizes_are_cached_separately(hass: HomeAssistant) -> None:
+    """Test each requested size is fetched once."""
+    cache = CameraImageCache()
+    fetch = AsyncMock(return_value=Image("image/jpeg", b"image"))
+
+    for _ in range(3):
+        await cache.async_get(hass, (None, None), fetch, 10)
+        await cache.async_get(hass, (320, 240), fetch, 10)
+
+    assert fetch.call_count == 2
+    assert cache.as_dict()["entries"] == 2
+
+
+async def test_memory_bounds(hass: HomeAssistant) -> None:
+    """Test the least recently used entries are evicted."""
+    cache = CameraImageCache(max_entries=2, max_bytes=10)
+    fetch = AsyncMock(return_value=Image("image/jpeg", b"1234"))
+
+    await cache.async_get(hass, (1, 1), fetch, 10)
+    await cache.async_get(hass, (2, 2), fetch, 10)
+    await cache.async_get(hass, (1, 1), fetch, 10)
+    await cache.async_get(hass, (3, 3), fetch, 10)
+    stats = cache.as_dict()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 8
+
+    # (1, 1) was used more recently than (2, 2)
+    await cache.async_get(hass, (1, 1), fetch, 10)
+    assert fetch.call_count == 3
+
+    # Images larger than the byte budget are never stored
+    fetch.return_value = Image("image/jpeg", b"12345678901")
+    await cache.async_get(hass, (4, 4), fetch, 10)
+    assert cache.as_dict()["bytes"] == 8
+
+
+async def test_failed_fetch_not_cached(hass: HomeAssistant) -> None:
+    """Test errors propagate to all waiters and are not cached."""
+    cache = CameraImageCache()
+    fetch = AsyncMock(side_effect=[HomeAssistantError, Image("image/jpeg", b"ok")])
+
+    with pytest.raises(HomeAssistantError):
+        await cache.async_get(hass, (None, None), fetch, 10)
+    assert (await cache.async_get(hass, (None, None), fetch, 10)).content == b"ok"
+
+
+async def test_waiter_timeout_does_not_cancel_fetch(hass: HomeAssistant) -> None:
+    """Test a caller giving up does not cancel the shared fetch."""
+    cache = CameraImageCache()
+    release = asyncio.Event()
+
+    async def _fetch() -> Image:
+        await release.wait()
+        return Image("image/jpeg", b"image")
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.01):
+            await cache.async_get(hass, (None, None), _fetch)
+
+    waiter = asyncio.create_task(cache.async_get(hass, (None, None), _fetch))
+    await asyncio.sleep(0)
+    release.set()
+    assert (await waiter).content == b"image"
+    assert cache.as_dict()["coalesced"] == 1
+
+
+async def test_fetch_error_after_waiters_time_out(hass: HomeAssistant) -> None:
+    """Test a failed fetch nobody waits for anymore does not log an error."""
+    cache = CameraImageCache()
+    release = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop_errors = []
+    loop.set_exception_handler(lambda loop, context: loop_errors.append(context))
+
+    async def _fetch() -> Image:
+        await release.wait()
+        raise HomeAssistantError
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.01):
+            await cache.async_get(hass, (None, None), _fetch)
+
+    release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    gc.collect()
+    loop.set_exception_handler(None)
+    assert loop_errors == []
+
+
+async def test_fetch_is_background_task(hass: HomeAssistant) -> None:
+    """Test the shared fetch is a named background task cancelled on shutdown."""
+    cache = CameraImageCache()
+
+    async def _fetch() -> Image:
+        await asyncio.Event().wait()
+        return Image("image/jpeg", b"image")
+
+    waiter = asyncio.create_task(cache.async_get(hass, (640, 480), _fetch))
+    await asyncio.sleep(0)
+    (task,) = hass._background_tasks
+    assert task.get_name() == "camera image fetch (640, 480)"
+
+    await hass.async_stop()
+    assert task.cancelled()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+@pytest.mark.usefixtures("mock_camera")
+async def test_camera_image_cache_ttl(hass: HomeAssistant) -> None:
+    """Test a camera opting in to the image cache."""
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_camera_image:
+        await camera.async_get_image(hass, "camera.demo_camera")
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 2
+
+        demo_camera = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+        demo_camera._attr_image_cache_ttl = 10
+        await camera.async_get_image(hass, "camera.demo_camera")
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 3
@@ -1,12 +1,16 @@
 """Test the Energy websocket API."""
+from datetime import timedelta
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from homeassistant.components.energy import data, is_configured
 from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    async_import_statistics,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -1155,3 +1159,129 @@ async def test_fossil_energy_consumption_check_missing_hour(
         hour3.isoformat(),
         hour4.isoformat(),
     ]
+
+
+async def test_dashboard_data(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test fetching all dashboard statistics in one command."""
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 01:00:00"))
+    period3 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 02:00:00"))
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "source": "test",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        {**metadata, "name": "Grid", "statistic_id": "test:grid"},
+        (
+            {"start": period1, "sum": 1},
+            {"start": period2, "sum": 3},
+            {"start": period3, "sum": 6},
+        ),
+    )
+    async_add_external_statistics(
+        hass,
+        {**metadata, "name": "Device", "statistic_id": "test:device"},
+        ({"start": period2, "sum": 1}, {"start": period3, "sum": 2}),
+    )
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": "Fossil percentage",
+            "source": "test",
+            "statistic_id": "test:fossil_percentage",
+            "unit_of_measurement": "%",
+        },
+        ({"start": period2, "mean": 50}, {"start": period3, "mean": 10}),
+    )
+    await async_wait_recording_done(hass)
+
+    manager = await data.async_get_manager(hass)
+    await manager.async_update(
+        {
+            "energy_sources": [
+                {
+                    "type": "grid",
+                    "flow_from": [
+                        {
+                            "stat_energy_from": "test:grid",
+                            "stat_cost": None,
+                            "entity_energy_price": None,
+                            "number_energy_price": None,
+                        },
+                        {
+                            "stat_energy_from": "sensor.grid_energy",
+                            "stat_cost": None,
+                            "entity_energy_price": None,
+                            "number_energy_price": 0.5,
+                        },
+                    ],
+                    "flow_to": [],
+                    "cost_adjustment_day": 0,
+                }
+            ],
+            "device_consumption": [{"stat_consumption": "test:device"}],
+        }
+    )
+    await hass.async_block_till_done()
+
+    # The priced flow gets an auto-generated cost sensor
+    cost_entity_id = hass.data["energy"]["cost_sensors"]["sensor.grid_energy"]
+    async_import_statistics(
+        hass,
+        {
+            **metadata,
+            "name": "Grid cost",
+            "source": "recorder",
+            "statistic_id": cost_entity_id,
+            "unit_of_measurement": "EUR",
+        },
+        (
+            {"start": period1, "sum": 0.5},
+            {"start": period2, "sum": 1.5},
+            {"start": period3, "sum": 3},
+        ),
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "energy/dashboard_data",
+        "start_time": period1.isoformat(),
+        "end_time": (period3 + timedelta(hours=1)).isoformat(),
+        "period": "hour",
+        "co2_statistic_id": "test:fossil_percentage",
+    }
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "start": [
+            int(period.timestamp() * 1000) for period in (period1, period2, period3)
+        ],
+        "series": {
+            "test:grid": [1.0, 2.0, 3.0],
+            "test:device": [None, 1.0, 1.0],
+            cost_entity_id: [0.5, 1.0, 1.5],
+            "fossil_energy_consumption": [1.0, 1.0, pytest.approx(0.3)],
+        },
+    }
+
+    # Periods in the past are served from the cache
+    with patch(
+        "homeassistant.components.recorder.statistics.statistics_during_period"
+    ) as mock_statistics:
+        await client.send_json({"id": 2, **request})
+        response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["series"]["test:grid"] == [1.0, 2.0, 3.0]
+    assert not mock_statistics.called
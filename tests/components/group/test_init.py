@@ -189,6 +189,45 @@ async def test_group_turns_on_if_all_are_off_and_one_turns_on(
     assert group_state.state == STATE_ON
 
 
+@pytest.mark.parametrize("mode", [None, True])
+async def test_group_state_matches_members_after_many_changes(
+    hass: HomeAssistant, mode: bool | None
+) -> None:
+    """Test the incrementally tracked group state matches its members."""
+    entity_ids = [f"light.light_{idx}" for idx in range(10)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+
+    assert await async_setup_component(hass, "group", {})
+
+    test_group = await group.Group.async_create_group(
+        hass,
+        "init_group",
+        created_by_service=True,
+        entity_ids=entity_ids,
+        icon=None,
+        mode=mode,
+        object_id=None,
+        order=None,
+    )
+
+    on: set[str] = set()
+    for step in range(40):
+        entity_id = entity_ids[(step * 7) % len(entity_ids)]
+        if entity_id in on:
+            on.remove(entity_id)
+            hass.states.async_set(entity_id, STATE_OFF)
+        else:
+            on.add(entity_id)
+            hass.states.async_set(entity_id, STATE_ON, {"assumed_state": step % 3 == 0})
+        await hass.async_block_till_done()
+
+        mode_func = all if mode else any
+        expected = mode_func(entity_id in on for entity_id in entity_ids)
+        group_state = hass.states.get(test_group.entity_id)
+        assert group_state.state == (STATE_ON if expected else STATE_OFF)
+
+
 async def test_allgroup_stays_off_if_all_are_off_and_one_turns_on(
     hass: HomeAssistant,
 ) -> None:
@@ -1744,3 +1744,63 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(calls) == 2
     assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_state_trigger_index(hass: HomeAssistant, calls) -> None:
+    """Test state triggers are only dispatched matching target states."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": to_state,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"to": str(to_state)},
+                    },
+                }
+                for to_state in ("on", "off", ["on", "unknown"], None)
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    index: state_trigger.StateTriggerIndex = hass.data[
+        state_trigger.DATA_STATE_TRIGGER_INDEX
+    ]
+    entity_triggers = index._entities["test.entity"]
+    assert {
+        state: len(listeners)
+        for state, listeners in entity_triggers.by_to_state.items()
+    } == {
+        "on": 2,
+        "off": 1,
+        "unknown": 1,
+    }
+    assert len(entity_triggers.any_state) == 1
+
+    hass.states.async_set("test.entity", "on")
+    await hass.async_block_till_done()
+    assert sorted(call.data["to"] for call in calls) == [
+        "None",
+        "['on', 'unknown']",
+        "on",
+    ]
+
+    calls.clear()
+    hass.states.async_set("test.entity", "off")
+    await hass.async_block_till_done()
+    assert sorted(call.data["to"] for call in calls) == ["None", "off"]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert "test.entity" not in index._entities
@@ -1,13 +1,22 @@
 """The tests for http static files."""
 
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 from aiohttp.test_utils import TestClient
 from aiohttp.web_exceptions import HTTPForbidden
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
-from homeassistant.components.http.static import CachingStaticResource, _get_file_path
+from homeassistant.components.http.static import (
+    CONTENT_CACHE_MAX_FILE_SIZE,
+    CONTENT_CACHE_REVALIDATE,
+    CachingStaticResource,
+    _get_file_path,
+    _load_file,
+)
 from homeassistant.core import EVENT_HOMEASSISTANT_START, HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -59,3 +68,229 @@ async def test_static_path_blocks_anchors(
     # changes we still block it.
     with pytest.raises(HTTPForbidden):
         _get_file_path(canonical_url, tmp_path)
+
+
+async def test_static_file_served_from_memory(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test small static files are cached in memory with gzip variants."""
+    (tmp_path / "app.js").write_text("console.log('hi');")
+    (tmp_path / "app.js.gz").write_bytes(b"gzipped")
+    resource = CachingStaticResource("/static_test", str(tmp_path))
+    hass.http.app.router.register_resource(resource)
+
+    resp = await mock_http_client.get(
+        "/static_test/app.js", headers={"Accept-Encoding": "identity"}
+    )
+    assert resp.status == 200
+    assert await resp.text() == "console.log('hi');"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    etag = resp.headers["ETag"]
+
+    resp = await mock_http_client.get(
+        "/static_test/app.js",
+        headers={"Accept-Encoding": "gzip"},
+        auto_decompress=False,
+    )
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert await resp.read() == b"gzipped"
+    assert resp.headers["ETag"] != etag
+
+    # Served from memory, the file is not touched on disk again
+    with patch("homeassistant.components.http.static._load_file") as mock_load_file:
+        resp = await mock_http_client.get(
+            "/static_test/app.js",
+            headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+        )
+    assert resp.status == 304
+    assert not mock_load_file.called
+
+
+async def test_static_file_revalidated(
+    hass: HomeAssistant,
+    mock_http_client: TestClient,
+    tmp_path: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test cached static files are checked for changes."""
+    (tmp_path / "app.js").write_text("old")
+    os.utime(tmp_path / "app.js", (1, 1))
+    resource = CachingStaticResource("/static_test", str(tmp_path))
+    hass.http.app.router.register_resource(resource)
+
+    resp = await mock_http_client.get("/static_test/app.js")
+    assert await resp.text() == "old"
+
+    (tmp_path / "app.js").write_text("new")
+    resp = await mock_http_client.get("/static_test/app.js")
+    assert await resp.text() == "old"
+
+    freezer.tick(CONTENT_CACHE_REVALIDATE + 1)
+    resp = await mock_http_client.get("/static_test/app.js")
+    assert await resp.text() == "new"
+
+
+async def test_static_file_removed(
+    hass: HomeAssistant,
+    mock_http_client: TestClient,
+    tmp_path: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a file removed after its path was resolved returns 404."""
+    (tmp_path / "app.js").write_text("content")
+    resource = CachingStaticResource("/static_test", str(tmp_path))
+    hass.http.app.router.register_resource(resource)
+
+    resp = await mock_http_client.get("/static_test/app.js")
+    assert resp.status == 200
+
+    (tmp_path / "app.js").unlink()
+    freezer.tick(CONTENT_CACHE_REVALIDATE + 1)
+    resp = await mock_http_client.get("/static_test/app.js")
+    assert resp.status == 404
+
+
+async def test_static_file_too_large_not_checked_again(
+    hass: HomeAssistant,
+    mock_http_client: TestClient,
+    tmp_path: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test files too large to cache are only checked for changes periodically."""
+    (tmp_path / "app.js").write_bytes(b"x" * (CONTENT_CACHE_MAX_FILE_SIZE + 1))
+    resource = CachingStaticResource("/static_test", str(tmp_path))
+    hass.http.app.router.register_resource(resource)
+
+    resp = await mock_http_client.get("/static_test/app.js")
+    assert resp.status == 200
+    assert len(await resp.read()) == CONTENT_CACHE_MAX_FILE_SIZE + 1
+
+    with patch(
+        "homeassistant.components.http.static._load_file", wraps=_load_file
+    ) as mock_load_file:
+        resp = await mock_http_client.get("/static_test/app.js")
+        assert resp.status == 200
+        assert not mock_load_file.called
+
+        (tmp_path / "app.js").write_text("small")
+        freezer.tick(CONTENT_CACHE_REVALIDATE + 1)
+        resp = await mock_http_client.get("/static_test/app.js")
+        assert await resp.text() == "small"
+        assert mock_load_file.called
+
+
+async def test_static_file_gzip_sibling_revalidated(
+    hass: HomeAssistant,
+    mock_http_client: TestClient,
+    tmp_path: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a replaced gzip sibling of an unchanged file is served."""
+    (tmp_path / "app.js").write_text("content")
+    (tmp_path / "app.js.gz").write_bytes(b"old gzipped")
+    os.utime(tmp_path / "app.js.gz", (1, 1))
+    resource = CachingStaticResource("/static_test", str(tmp_path))
+    hass.http.app.router.register_resource(resource)
+
+    resp = await mock_http_client.get(
+        "/static_test/app.js",
+        headers={"Accept-Encoding": "gzip"},
+        auto_decompress=False,
+    )
+    assert await resp.read() == b"old gzipped"
+    etag = resp.headers["ETag"]
+
+    (tmp_path / "app.js.gz").write_bytes(b"new gzipped")
+    freezer.tick(CONTENT_CACHE_REVALIDATE + 1)
+    resp = await mock_http_client.get(
+        "/static_test/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+        auto_decompress=False,
+    )
+    assert resp.status == 200
+    assert await resp.read() == b"new gzipped"
+    assert resp.headers["ETag"] != etag
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "gzip_served"),
+    (
+        ("gzip", True),
+        ("deflate, gzip;q=0.5", True),
+        ("GZIP; Q=1", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, identity", False),
+        ("x-gzip", False),
+        ("identity", False),
+    ),
+)
+async def test_static_file_gzip_quality(
+    hass: HomeAssistant,
+    mock_http_client: TestClient,
+    tmp_path: Path,
+    accept_encoding: str,
+    gzip_served: bool,
+) -> None:
+    """Test the gzip sibling is only served when gzip is acceptable."""
+    (tmp_path / "app.js").write_text("content")
+    (tmp_path / "app.js.gz").write_bytes(b"gzipped")
+    resource = CachingStaticResource("/static_test", str(tmp_path))
+    hass.http.app.router.register_resource(resource)
+
+    resp = await mock_http_client.get(
+        "/static_test/app.js",
+        headers={"Accept-Encoding": accept_encoding},
+        auto_decompress=False,
+    )
+    assert resp.status == 200
+    if gzip_served:
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert await resp.read() == b"gzipped"
+    else:
+        assert "Content-Encoding" not in resp.headers
+        assert await resp.read() == b"content"
+
+
+@pytest.mark.parametrize(
+    "size", (10, CONTENT_CACHE_MAX_FILE_SIZE + 1), ids=("memory", "disk")
+)
+async def test_static_file_conditional_requests(
+    hass: HomeAssistant,
+    mock_http_client: TestClient,
+    tmp_path: Path,
+    size: int,
+) -> None:
+    """Test files from memory answer conditional requests like those from disk."""
+    (tmp_path / "app.js").write_bytes(b"x" * size)
+    os.utime(tmp_path / "app.js", (1_000_000_000, 1_000_000_000))
+    resource = CachingStaticResource("/static_test", str(tmp_path))
+    hass.http.app.router.register_resource(resource)
+
+    resp = await mock_http_client.get("/static_test/app.js")
+    assert resp.status == 200
+    assert resp.headers["Last-Modified"] == "Sun, 09 Sep 2001 01:46:40 GMT"
+    etag = resp.headers["ETag"]
+
+    for headers, status in (
+        ({"If-Modified-Since": "Sun, 09 Sep 2001 01:46:40 GMT"}, 304),
+        ({"If-Modified-Since": "Sun, 09 Sep 2001 01:46:39 GMT"}, 200),
+        (
+            {
+                "If-None-Match": '"other"',
+                "If-Modified-Since": "Sun, 09 Sep 2001 01:46:40 GMT",
+            },
+            200,
+        ),
+        ({"If-None-Match": f"W/{etag}"}, 200),
+        ({"If-None-Match": "*"}, 304),
+        ({"If-Match": etag}, 200),
+        ({"If-Match": '"other"'}, 412),
+        ({"If-Unmodified-Since": "Sun, 09 Sep 2001 01:46:39 GMT"}, 412),
+        ({"If-Unmodified-Since": "Sun, 09 Sep 2001 01:46:40 GMT"}, 200),
+    ):
+        resp = await mock_http_client.get("/static_test/app.js", headers=headers)
+        assert resp.status == status, headers
+        if status == 304:
+            assert resp.headers["ETag"] == etag
+            assert resp.headers["Last-Modified"] == "Sun, 09 Sep 2001 01:46:40 GMT"
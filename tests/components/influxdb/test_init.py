@@ -1411,6 +1411,25 @@ async def test_event_listener_backlog_full(
         assert get_write_api(mock_client).call_count == 0
 
 
+async def test_event_listener_backlog_larger_batches(hass: HomeAssistant) -> None:
+    """Test a backlog of events is written in larger batches."""
+    instance = await hass.async_add_executor_job(
+        influxdb.InfluxThread, hass, Mock(), lambda event: {"event": event}, 0
+    )
+    for idx in range(influxdb.BATCH_BUFFER_SIZE + 150):
+        instance.queue.put((influxdb.time.monotonic(), idx))
+
+    count, json = await hass.async_add_executor_job(instance.get_events_json)
+    assert count == influxdb.BATCH_BUFFER_SIZE + 150
+    assert len(json) == influxdb.BATCH_BUFFER_SIZE + 150
+
+    with patch(f"{INFLUX_PATH}.BATCH_BUFFER_SIZE_MAX", 10):
+        for idx in range(20):
+            instance.queue.put((influxdb.time.monotonic(), idx))
+        count, json = await hass.async_add_executor_job(instance.get_events_json)
+    assert count == 10
+
+
 @pytest.mark.parametrize(
     ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
     [
@@ -179,6 +179,78 @@ async def test_view_default_namespace(client, sensor_entities) -> None:
     )
 
 
+async def test_view_openmetrics_and_gzip(hass: HomeAssistant, hass_client) -> None:
+    """Test the view negotiates OpenMetrics and gzip."""
+    prometheus_client.REGISTRY = prometheus_client.CollectorRegistry(auto_describe=True)
+    assert await async_setup_component(hass, prometheus.DOMAIN, {prometheus.DOMAIN: {}})
+    hass.states.async_set("sensor.outside_temperature", "15.6")
+    await hass.async_block_till_done()
+    client = await hass_client()
+
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={
+            "Accept": "application/openmetrics-text; version=1.0.0",
+            "Accept-Encoding": "gzip",
+        },
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"].startswith("application/openmetrics-text")
+    assert resp.headers["content-encoding"] == "gzip"
+    body = await resp.text()
+    assert body.endswith("# EOF\n")
+    assert 'entity="sensor.outside_temperature"' in body
+
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "identity"}
+    )
+    assert resp.headers["content-type"] == CONTENT_TYPE_TEXT_PLAIN
+    assert "content-encoding" not in resp.headers
+    assert resp.headers["vary"] == "Accept, Accept-Encoding"
+
+
+async def test_view_failed_render_retrieved(hass: HomeAssistant) -> None:
+    """Test a failed render is retrieved and not cached."""
+    view = prometheus.PrometheusView(False)
+    key = (prometheus_client.generate_latest, False)
+    view._renders[key] = render = hass.loop.create_future()
+    render.set_exception(ValueError())
+
+    view._async_render_done(key, render)
+
+    assert not view._renders
+    assert not view._cache
+    assert not render._log_traceback
+
+
+async def test_view_scrape_cache_time(hass: HomeAssistant, hass_client) -> None:
+    """Test renders are reused until the scrape cache time expires."""
+    prometheus_client.REGISTRY = prometheus_client.CollectorRegistry(auto_describe=True)
+    assert await async_setup_component(
+        hass,
+        prometheus.DOMAIN,
+        {prometheus.DOMAIN: {prometheus.CONF_SCRAPE_CACHE_TIME: 10}},
+    )
+    hass.states.async_set("sensor.outside_temperature", "15.6")
+    await hass.async_block_till_done()
+    client = await hass_client()
+
+    with mock.patch(f"{PROMETHEUS_PATH}.time.monotonic", return_value=100), mock.patch(
+        "prometheus_client.exposition.generate_latest",
+        wraps=prometheus_client.generate_latest,
+    ) as mock_generate_latest:
+        await generate_latest_metrics(client)
+        await generate_latest_metrics(client)
+        assert mock_generate_latest.call_count == 1
+
+    with mock.patch(f"{PROMETHEUS_PATH}.time.monotonic", return_value=111), mock.patch(
+        "prometheus_client.exposition.generate_latest",
+        wraps=prometheus_client.generate_latest,
+    ) as mock_generate_latest:
+        await generate_latest_metrics(client)
+        assert mock_generate_latest.call_count == 1
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(client, sensor_entities) -> None:
     """Test prometheus metrics for sensors with a unit."""
@@ -0,0 +1,97 @@
+"""The tests for the recorder state attributes manager."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def test_unchanged_attributes_are_not_serialized_again(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test attributes are only serialized again when they change."""
+    await async_setup_recorder_instance(hass)
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as mock_serialize:
+        hass.states.async_set("sensor.test", "1", {"unit": "W"})
+        await async_wait_recording_done(hass)
+        assert mock_serialize.call_count == 1
+
+        hass.states.async_set("sensor.test", "2", {"unit": "W"})
+        await async_wait_recording_done(hass)
+        assert mock_serialize.call_count == 1
+
+        hass.states.async_set("sensor.test", "3", {"unit": "kW"})
+        await async_wait_recording_done(hass)
+        assert mock_serialize.call_count == 2
+
+        hass.states.async_remove("sensor.test")
+        await async_wait_recording_done(hass)
+        hass.states.async_set("sensor.test", "3", {"unit": "kW"})
+        await async_wait_recording_done(hass)
+        assert mock_serialize.call_count == 4
+
+
+async def test_unchanged_attributes_serialized_again_when_exclusions_change(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test unchanged attributes are serialized again when exclusions change."""
+    await async_setup_recorder_instance(hass)
+    attributes = {"unit": "W", "extra": 1}
+
+    hass.states.async_set(
+        "sensor.test",
+        "1",
+        attributes,
+        state_info={"unrecorded_attributes": frozenset()},
+    )
+    await async_wait_recording_done(hass)
+    hass.states.async_set(
+        "sensor.test",
+        "2",
+        attributes,
+        state_info={"unrecorded_attributes": frozenset({"extra"})},
+    )
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert {row.shared_attrs for row in session.query(StateAttributes)} == {
+            '{"unit":"W","extra":1}',
+            '{"unit":"W"}',
+        }
+
+
+async def test_lru_grows_when_entries_are_evicted(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the LRU records metrics and grows when its working set does not fit."""
+    instance = await async_setup_recorder_instance(hass)
+    manager = instance.state_attributes_manager
+    manager._id_map.set_size(2)
+
+    for idx in range(4):
+        hass.states.async_set(f"sensor.test_{idx}", "on", {"idx": idx})
+    await async_wait_recording_done(hass)
+
+    info = manager.cache_info()
+    assert info["size"] == 2
+    assert info["entries"] == 2
+    assert info["evictions"] == 2
+
+    manager.adjust_lru_size(0)
+    assert manager.cache_info()["size"] == 3
+    # No evictions since the last adjustment so it does not grow again
+    manager.adjust_lru_size(0)
+    assert manager.cache_info()["size"] == 3
+    manager.adjust_lru_size(100)
+    assert manager.cache_info()["size"] == 100
@@ -380,6 +380,79 @@ async def test_purge_old_statistics_runs(
         assert statistics_runs.count() == 1
 
 
+async def test_purge_old_short_term_statistics_by_id_range(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test short term statistics are purged by id range in batches."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    utcnow = dt_util.utcnow()
+    old_start = (utcnow - timedelta(days=11)).timestamp()
+    with session_scope(hass=hass) as session:
+        # A recent row in the middle of the id range of old rows must be kept
+        session.add_all(
+            StatisticsShortTerm(start_ts=start_ts)
+            for start_ts in (
+                old_start,
+                old_start + 1,
+                utcnow.timestamp(),
+                old_start + 2,
+            )
+        )
+
+    purge_before = utcnow - timedelta(days=4)
+    with session_scope(hass=hass) as session:
+        statistics = session.query(StatisticsShortTerm)
+        with patch(
+            "homeassistant.components.recorder.purge.DEFAULT_SHORT_TERM_STATISTICS_BATCHES_PER_PURGE",
+            1,
+        ), patch.object(instance, "max_bind_vars", 2):
+            assert not purge_old_data(instance, purge_before, repack=False)
+            assert statistics.count() == 2
+            assert not purge_old_data(instance, purge_before, repack=False)
+            assert purge_old_data(instance, purge_before, repack=False)
+        assert [row.start_ts for row in statistics] == [utcnow.timestamp()]
+
+
+async def test_purge_old_short_term_statistics_ids_not_in_start_order(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a batch is bounded when ids and start times are in different order."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    utcnow = dt_util.utcnow()
+    old_start = (utcnow - timedelta(days=11)).timestamp()
+    with session_scope(hass=hass) as session:
+        # The two oldest rows have the lowest and the highest id
+        session.add_all(
+            StatisticsShortTerm(start_ts=start_ts)
+            for start_ts in (
+                old_start,
+                old_start + 10,
+                old_start + 11,
+                old_start + 1,
+            )
+        )
+
+    purge_before = utcnow - timedelta(days=4)
+    with session_scope(hass=hass) as session:
+        statistics = session.query(StatisticsShortTerm)
+        with patch(
+            "homeassistant.components.recorder.purge.DEFAULT_SHORT_TERM_STATISTICS_BATCHES_PER_PURGE",
+            1,
+        ), patch.object(instance, "max_bind_vars", 2):
+            assert not purge_old_data(instance, purge_before, repack=False)
+            assert sorted(row.start_ts for row in statistics) == [
+                old_start + 1,
+                old_start + 11,
+            ]
+            assert not purge_old_data(instance, purge_before, repack=False)
+            assert statistics.count() == 0
+            assert purge_old_data(instance, purge_before, repack=False)
+
+
 @pytest.mark.parametrize("use_sqlite", (True, False), indirect=True)
 async def test_purge_method(
     async_setup_recorder_instance: RecorderInstanceGenerator,
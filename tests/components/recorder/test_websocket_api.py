@@ -2084,6 +2084,14 @@ async def test_recorder_info(
     await client.send_json_auto_id({"type": "recorder/info"})
     response = await client.receive_json()
     assert response["success"]
+    caches = response["result"].pop("caches")
+    assert set(caches) == {
+        "event_data",
+        "event_types",
+        "state_attributes",
+        "states_meta",
+    }
+    assert caches["states_meta"]["size"] == 8192
     assert response["result"] == {
         "backlog": 0,
         "max_backlog": 65000,
@@ -577,3 +577,18 @@ async def test_hls_stream_rotate(
 
     # Stop stream, if it hasn't quit already
     await stream.stop()
+
+
+def test_segment_get_data_shares_part_buffers() -> None:
+    """Test the parts of a complete segment are joined only once."""
+    segment = Segment(sequence=0)
+    segment.async_add_part(Part(duration=1, has_keyframe=True, data=b"part0"), 0)
+    assert segment.get_data() == b"part0"
+
+    segment.async_add_part(Part(duration=1, has_keyframe=False, data=b"part1"), 2)
+    data = segment.get_data()
+    assert data == b"part0part1"
+    assert segment.get_data() is data
+    assert [part.data for part in segment.parts] == [b"part0", b"part1"]
+    assert all(isinstance(part.data, memoryview) for part in segment.parts)
+    assert segment.data_size == len(data)
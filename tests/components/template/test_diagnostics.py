@@ -0,0 +1,86 @@
+"""Test template diagnostics."""
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components import template
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+from tests.typing import ClientSessionGenerator
+
+
+async def test_diagnostics(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test diagnostics include the template dependency graph."""
+    assert await async_setup_component(hass, "diagnostics", {})
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+
+    assert await async_setup_component(
+        hass,
+        "template",
+        {
+            "template": {
+                "sensor": [
+                    {
+                        "name": "Downstream",
+                        "state": "{{ states('sensor.my_template') }}",
+                    },
+                    {
+                        "name": "Unrelated",
+                        "state": "{{ states('sensor.one') }}",
+                    },
+                ],
+                "binary_sensor": {
+                    "name": "Domain dependent",
+                    "state": "{{ states.sensor | selectattr('state', 'eq', '3') | list | count > 0 }}",
+                },
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    config_entry = MockConfigEntry(
+        data={},
+        domain=template.DOMAIN,
+        options={
+            "name": "My template",
+            "state": "{{ states('sensor.one') | int + states('sensor.two') | int }}",
+            "template_type": "sensor",
+        },
+        title="My template",
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    # Domain listeners are only set up once the rate limit allows a render
+    freezer.tick(timedelta(seconds=5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
+        "options": {
+            "name": "My template",
+            "state": "{{ states('sensor.one') | int + states('sensor.two') | int }}",
+            "template_type": "sensor",
+        },
+        "entities": {
+            "sensor.my_template": {
+                "all": False,
+                "domains": [],
+                "entities": ["sensor.one", "sensor.two"],
+                "time": False,
+                "template_dependents": [
+                    "binary_sensor.domain_dependent",
+                    "sensor.downstream",
+                ],
+            }
+        },
+    }
@@ -0,0 +1,41 @@
+"""Test the trace models."""
+import pytest
+
+from homeassistant.components.script.trace import ScriptTrace
+from homeassistant.core import Context
+from homeassistant.helpers.trace import script_execution_set, trace_clear
+
+
+@pytest.mark.parametrize(
+    ("script_execution", "failed"),
+    [
+        ("aborted", True),
+        ("disallowed_recursion_detected", True),
+        ("error", True),
+        ("failed_max_runs", True),
+        ("failed_single", True),
+        ("cancelled", False),
+        ("failed_conditions", False),
+        ("finished", False),
+    ],
+)
+@pytest.mark.parametrize("finished", [True, False])
+async def test_action_trace_failed(
+    script_execution: str, failed: bool, finished: bool
+) -> None:
+    """Test a trace is failed from its script execution, finished or not."""
+    trace_clear()
+    trace = ScriptTrace("sun", {}, {}, Context())
+    assert not trace.failed
+
+    script_execution_set(script_execution)
+    if finished:
+        trace.finished()
+    assert trace.failed is failed
+
+
+async def test_action_trace_failed_error() -> None:
+    """Test a trace with an error is failed."""
+    trace = ScriptTrace("sun", {}, {}, Context())
+    trace.set_error(ValueError("Boom"))
+    assert trace.failed
@@ -15,7 +15,7 @@ from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.util.uuid import random_uuid_hex
 
-from tests.common import load_fixture
+from tests.common import async_capture_events, load_fixture
 from tests.typing import WebSocketGenerator
 
 
@@ -587,6 +587,163 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("level", "stored_runs"),
+    [
+        ("full", ["bad", "good"]),
+        ("sampled", ["good"]),
+        ("errors", ["bad"]),
+        ("off", []),
+    ],
+)
+async def test_trace_level(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    level: str,
+    stored_runs: list[str],
+) -> None:
+    """Test the trace level controls which runs are stored."""
+    good_config = {
+        "id": "good",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+        "trace": {"level": level},
+    }
+    bad_config = {
+        "id": "bad",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"stop": "Failed", "error": True},
+        "trace": {"level": level},
+    }
+    if domain == "script":
+        configs = {
+            config["id"]: {"sequence": config["action"], "trace": config["trace"]}
+            for config in (good_config, bad_config)
+        }
+    else:
+        configs = [good_config, bad_config]
+    assert await async_setup_component(hass, domain, {domain: configs})
+
+    # At the sampled level, only the first run is sampled
+    with patch("homeassistant.components.trace.random.random", side_effect=[0.05, 0.5]):
+        await _run_automation_or_script(hass, domain, good_config, "test_event")
+        await _run_automation_or_script(hass, domain, bad_config, "test_event2")
+        await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert sorted(trace["item_id"] for trace in response["result"]) == stored_runs
+
+
+async def test_trace_level_errors_failed_single(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test runs rejected by the script mode are stored at the errors level."""
+    assert await async_setup_component(
+        hass,
+        "script",
+        {
+            "script": {
+                "sun": {
+                    "sequence": {"wait_template": "{{ false }}"},
+                    "mode": "single",
+                    "trace": {"level": "errors"},
+                }
+            }
+        },
+    )
+    await hass.services.async_call(
+        "script", "turn_on", {"entity_id": "script.sun"}, blocking=True
+    )
+    # The second run is rejected while the first one is waiting
+    await hass.services.async_call("script", "sun", blocking=True)
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": "script"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]) == 1
+    assert response["result"][0]["script_execution"] == "failed_single"
+
+    await hass.services.async_call(
+        "script", "turn_off", {"entity_id": "script.sun"}, blocking=True
+    )
+
+
+@pytest.mark.parametrize(
+    ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
+)
+async def test_breakpoints_trace_level_off(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain, prefix
+) -> None:
+    """Test breakpoints halt runs which are not traced."""
+    events = async_capture_events(hass, "event1")
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"event": "event0"}, {"event": "event1"}],
+        "trace": {"level": "off"},
+    }
+    if domain == "script":
+        configs = {
+            "sun": {"sequence": sun_config["action"], "trace": sun_config["trace"]}
+        }
+    else:
+        configs = [sun_config]
+    assert await async_setup_component(hass, domain, {domain: configs})
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/debug/breakpoint/subscribe"})
+    response = await client.receive_json()
+    assert response["success"]
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/debug/breakpoint/set",
+            "domain": domain,
+            "item_id": "sun",
+            "node": f"{prefix}/1",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+
+    response = await client.receive_json()
+    run_id = response["event"]["run_id"]
+    assert response["event"] == {
+        "domain": domain,
+        "item_id": "sun",
+        "node": f"{prefix}/1",
+        "run_id": run_id,
+    }
+    assert len(events) == 0
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "trace/debug/continue",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+    await client.send_json({"id": 4, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == []
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
@@ -22,15 +22,21 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
+    async_setup_component,
+)
 from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
+    MockModule,
     MockUser,
     async_mock_service,
+    mock_integration,
     mock_platform,
 )
 from tests.typing import (
@@ -2508,6 +2514,33 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_setup_timeline(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the integration setup timeline."""
+    mock_integration(hass, MockModule("http"))
+    mock_integration(hass, MockModule("cloud", dependencies=["http"]))
+    hass.data[DATA_SETUP_TIMELINE] = {
+        "cloud": (102.0, 110.0),
+        "http": (100.0, 102.0),
+    }
+    await websocket_client.send_json({"id": 7, "type": "integration/setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {
+        "integrations": [
+            {"domain": "http", "start": 0.0, "seconds": 2.0},
+            {"domain": "cloud", "start": 2.0, "seconds": 8.0},
+        ],
+        "critical_path": ["http", "cloud"],
+    }
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
@@ -2,6 +2,7 @@
 from typing import Any
 from unittest.mock import call, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from zeroconf import (
     BadTypeInNameException,
@@ -22,6 +23,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.generated import zeroconf as zc_gen
 from homeassistant.setup import ATTR_COMPONENT, async_setup_component
 
+from tests.common import MockConfigEntry, MockModule, mock_integration
+
 NON_UTF8_VALUE = b"ABCDEF\x8a"
 NON_ASCII_KEY = b"non-ascii-key\x8a"
 PROPERTIES = {
@@ -293,6 +296,112 @@ async def test_zeroconf_match_macaddress(
     assert mock_config_flow.mock_calls[0][2]["context"] == {"source": "zeroconf"}
 
 
+async def test_zeroconf_unchanged_update_ignored(
+    hass: HomeAssistant, mock_async_zeroconf: None
+) -> None:
+    """Test an update without changes does not trigger discovery again."""
+    browser_args = {}
+
+    def _capture_handlers(zeroconf, services, handlers):
+        browser_args["zeroconf"] = zeroconf
+        browser_args["handler"] = handlers[0]
+
+    def _update(state_change: ServiceStateChange) -> None:
+        browser_args["handler"](
+            browser_args["zeroconf"],
+            "_http._tcp.local.",
+            "Shelly108._http._tcp.local.",
+            state_change,
+        )
+
+    with patch.dict(
+        zc_gen.ZEROCONF,
+        {"_http._tcp.local.": [{"domain": "shelly", "name": "shelly*"}]},
+        clear=True,
+    ), patch.object(
+        hass.config_entries.flow, "async_init"
+    ) as mock_config_flow, patch.object(
+        zeroconf, "AsyncServiceBrowser", side_effect=_capture_handlers
+    ), patch(
+        "homeassistant.components.zeroconf.AsyncServiceInfo",
+        side_effect=get_zeroconf_info_mock("FFAADDCC11DD"),
+    ):
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        _update(ServiceStateChange.Added)
+        _update(ServiceStateChange.Updated)
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 1
+
+        _update(ServiceStateChange.Removed)
+        _update(ServiceStateChange.Added)
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 2
+
+        mock_integration(hass, MockModule("test"))
+        entry = MockConfigEntry(domain="test")
+        entry.add_to_hass(hass)
+        _update(ServiceStateChange.Updated)
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 2
+
+        await hass.config_entries.async_remove(entry.entry_id)
+        _update(ServiceStateChange.Updated)
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 3
+
+
+async def test_zeroconf_unchanged_update_discovered_again_after_ttl(
+    hass: HomeAssistant, mock_async_zeroconf: None, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test an unchanged device is discovered again after its flow aborted."""
+    browser_args = {}
+
+    def _capture_handlers(zeroconf, services, handlers):
+        browser_args["zeroconf"] = zeroconf
+        browser_args["handler"] = handlers[0]
+
+    def _update(state_change: ServiceStateChange) -> None:
+        browser_args["handler"](
+            browser_args["zeroconf"],
+            "_http._tcp.local.",
+            "Shelly108._http._tcp.local.",
+            state_change,
+        )
+
+    with patch.dict(
+        zc_gen.ZEROCONF,
+        {"_http._tcp.local.": [{"domain": "shelly", "name": "shelly*"}]},
+        clear=True,
+    ), patch.object(
+        hass.config_entries.flow, "async_init", return_value={"type": "abort"}
+    ) as mock_config_flow, patch.object(
+        zeroconf, "AsyncServiceBrowser", side_effect=_capture_handlers
+    ), patch(
+        "homeassistant.components.zeroconf.AsyncServiceInfo",
+        side_effect=get_zeroconf_info_mock("FFAADDCC11DD"),
+    ):
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        _update(ServiceStateChange.Added)
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 1
+
+        freezer.tick(zeroconf.UNCHANGED_SERVICE_INFO_TTL - 1)
+        _update(ServiceStateChange.Updated)
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 1
+
+        freezer.tick(1)
+        _update(ServiceStateChange.Updated)
+        await hass.async_block_till_done()
+        assert len(mock_config_flow.mock_calls) == 2
+
+
 async def test_zeroconf_match_manufacturer(
     hass: HomeAssistant, mock_async_zeroconf: None
 ) -> None:
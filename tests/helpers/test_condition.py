@@ -170,6 +170,51 @@ async def test_and_condition(hass: HomeAssistant) -> None:
     )
 
 
+async def test_condition_not_traced_without_active_trace(
+    hass: HomeAssistant,
+) -> None:
+    """Test conditions evaluated outside of a trace do not record one."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "state",
+                "entity_id": "sensor.temperature",
+                "state": "100",
+            },
+            {
+                "condition": "or",
+                "conditions": [
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": "sensor.temperature",
+                        "below": 110,
+                    },
+                ],
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 100)
+    trace.trace_cv.set(None)
+    assert test(hass)
+    assert trace.trace_get(clear=False) is None
+    assert trace.trace_stack_cv.get() is None
+    assert trace.trace_path_stack_cv.get() is None
+
+    hass.states.async_set("sensor.temperature", 120)
+    assert not test(hass)
+    assert trace.trace_get(clear=False) is None
+
+    hass.states.async_remove("sensor.temperature")
+    with pytest.raises(ConditionError):
+        test(hass)
+    assert trace.trace_get(clear=False) is None
+
+
 async def test_and_condition_raises(hass: HomeAssistant) -> None:
     """Test the 'and' condition."""
     config = {
@@ -981,6 +981,35 @@ async def test_removing_area_id(
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_area(
+    device_registry: dr.DeviceRegistry, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test the area index is kept up to date."""
+    entry_1 = device_registry.async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id,
+        identifiers={("bridgeid", "0123")},
+    )
+    entry_2 = device_registry.async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id,
+        identifiers={("bridgeid", "4567")},
+    )
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+
+    entry_1 = device_registry.async_update_device(entry_1.id, area_id="kitchen")
+    entry_2 = device_registry.async_update_device(entry_2.id, area_id="kitchen")
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [entry_1, entry_2]
+
+    entry_1 = device_registry.async_update_device(entry_1.id, area_id="garage")
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [entry_2]
+    assert dr.async_entries_for_area(device_registry, "garage") == [entry_1]
+
+    device_registry.async_clear_area_id("kitchen")
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+
+    device_registry.async_remove_device(entry_1.id)
+    assert dr.async_entries_for_area(device_registry, "garage") == []
+
+
 async def test_specifying_via_device_create(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
@@ -217,3 +217,43 @@ async def test_dispatcher_add_dispatcher(hass: HomeAssistant) -> None:
     async_dispatcher_send(hass, "test", 5)
 
     assert calls == [3, 4, 4, 5, 5]
+
+
+async def test_dispatcher_remove_dispatcher(hass: HomeAssistant) -> None:
+    """Test removing a dispatcher from a dispatcher."""
+    calls = []
+
+    @callback
+    def _second_dispatcher(data):
+        calls.append(("second", data))
+
+    @callback
+    def _remove_second_dispatcher(data):
+        calls.append(("first", data))
+        unsub()
+
+    async_dispatcher_connect(hass, "test", _remove_second_dispatcher)
+    unsub = async_dispatcher_connect(hass, "test", _second_dispatcher)
+
+    async_dispatcher_send(hass, "test", 3)
+    async_dispatcher_send(hass, "test", 4)
+
+    assert calls == [("first", 3), ("second", 3), ("first", 4)]
+
+
+async def test_dispatcher_reconnect_after_last_removed(hass: HomeAssistant) -> None:
+    """Test connecting again after all targets of a signal were removed."""
+    calls = []
+
+    @callback
+    def _dispatcher(data):
+        calls.append(data)
+
+    unsub = async_dispatcher_connect(hass, "test", _dispatcher)
+    async_dispatcher_send(hass, "test", 3)
+    unsub()
+    async_dispatcher_send(hass, "test", 4)
+    async_dispatcher_connect(hass, "test", _dispatcher)
+    async_dispatcher_send(hass, "test", 5)
+
+    assert calls == [3, 5]
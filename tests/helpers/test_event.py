@@ -20,6 +20,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_UTC_TIME_CHANGE_GROUPS,
     EventStateChangedData,
     TrackStates,
     TrackTemplate,
@@ -1737,6 +1738,101 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_attribute_changes(hass: HomeAssistant) -> None:
+    """Test attribute only changes re-render only templates reading attributes."""
+    hass.states.async_set("sensor.one", "on", {"level": 1})
+    hass.states.async_set("sensor.two", "off", {"level": 2})
+
+    templates = {
+        "entity_state": Template("{{ states('sensor.one') }}", hass),
+        "entity_attribute": Template("{{ state_attr('sensor.one', 'level') }}", hass),
+        "domain_state": Template(
+            "{{ states.sensor | selectattr('state', 'eq', 'on') | list | count }}",
+            hass,
+        ),
+        "domain_attribute": Template(
+            "{{ states.sensor | map(attribute='attributes.level') | sum }}", hass
+        ),
+    }
+    renders: dict[str, int] = {name: 0 for name in templates}
+    original_render_to_info = Template.async_render_to_info
+    names = {template: name for name, template in templates.items()}
+
+    def _count_render(self: Template, *args, **kwargs):
+        renders[names[self]] += 1
+        return original_render_to_info(self, *args, **kwargs)
+
+    with patch.object(Template, "async_render_to_info", _count_render):
+        for template in templates.values():
+            async_track_template_result(
+                hass,
+                [TrackTemplate(template, None, timedelta(seconds=0))],
+                lambda event, updates: None,
+            )
+        await hass.async_block_till_done()
+        assert renders == dict.fromkeys(templates, 1)
+
+        hass.states.async_set("sensor.one", "on", {"level": 3})
+        hass.states.async_set("sensor.two", "off", {"level": 4})
+        await hass.async_block_till_done()
+        assert renders == {
+            "entity_state": 1,
+            "entity_attribute": 2,
+            "domain_state": 1,
+            "domain_attribute": 3,
+        }
+
+        hass.states.async_set("sensor.two", "on", {"level": 4})
+        await hass.async_block_till_done()
+        assert renders == {
+            "entity_state": 1,
+            "entity_attribute": 2,
+            "domain_state": 2,
+            "domain_attribute": 4,
+        }
+
+        hass.states.async_set("sensor.one", "on", {"level": 4}, force_update=True)
+        await hass.async_block_till_done()
+        assert renders == {
+            "entity_state": 2,
+            "entity_attribute": 3,
+            "domain_state": 3,
+            "domain_attribute": 5,
+        }
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states.sensor.one.as_dict() }}",
+        "{{ states.sensor.one.as_dict_json }}",
+        "{{ states.sensor.one.as_compressed_state }}",
+        "{{ states.sensor.one.last_updated_timestamp }}",
+    ],
+)
+async def test_track_template_result_shared_state_attribute_changes(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test templates sharing a cached template state see attribute changes."""
+    hass.states.async_set("sensor.one", "on", {"level": 1})
+
+    runs: dict[str, list[str]] = {"first": [], "second": []}
+    for name, runs_for_template in runs.items():
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template(f"{name}: {template_str}", hass), None)],
+            lambda event, updates, runs_for_template=runs_for_template: (
+                runs_for_template.append(updates.pop().result)
+            ),
+        )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "on", {"level": 2})
+    await hass.async_block_till_done()
+    assert len(runs["first"]) == 1
+    assert len(runs["second"]) == 1
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -3900,6 +3996,90 @@ async def test_periodic_task_minute(
     assert len(specific_runs) == 2
 
 
+async def test_periodic_task_shared_timer(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test periodic tasks with the same pattern share a timer."""
+    runs_1 = []
+    runs_2 = []
+
+    now = dt_util.utcnow()
+    freezer.move_to(datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC))
+
+    with patch("homeassistant.helpers.event.randrange", return_value=100000):
+        unsub_1 = async_track_utc_time_change(
+            hass, callback(lambda x: runs_1.append(x)), minute="/5", second=0
+        )
+        unsub_2 = async_track_utc_time_change(
+            hass, callback(lambda x: runs_2.append(x)), minute="/5", second=0
+        )
+    groups = hass.data[TRACK_UTC_TIME_CHANGE_GROUPS]
+    assert len(groups) == 1
+    assert len(next(iter(groups.values())).jobs) == 2
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+    assert len(runs_2) == 1
+
+    unsub_1()
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_1) == 1
+    assert len(runs_2) == 2
+
+    unsub_2()
+    assert groups == {}
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 10, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs_2) == 2
+
+
+async def test_periodic_task_shared_timer_job_raises(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failing job does not stop other jobs sharing the timer."""
+    runs = []
+
+    @callback
+    def _raise(now: datetime) -> None:
+        raise ValueError("boom")
+
+    now = dt_util.utcnow()
+    freezer.move_to(datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC))
+
+    with patch("homeassistant.helpers.event.randrange", return_value=100000):
+        unsub_1 = async_track_utc_time_change(hass, _raise, minute="/5", second=0)
+        unsub_2 = async_track_utc_time_change(
+            hass, callback(lambda x: runs.append(x)), minute="/5", second=0
+        )
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert "boom" in caplog.text
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+
+    unsub_1()
+    unsub_2()
+
+
 async def test_periodic_task_hour(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -5036,6 +5036,30 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+@pytest.mark.parametrize(
+    ("template_str", "has_attributes"),
+    [
+        ('{{ states("sensor.test") }}', False),
+        ("{{ states.sensor.test.state }}", False),
+        ("{{ states.sensor.test.last_changed }}", False),
+        ("{{ states.sensor | selectattr('state', 'eq', 'on') | list }}", True),
+        ("{{ states.sensor | selectattr('state', 'eq', 'on') | list | count }}", False),
+        ('{{ state_attr("sensor.test", "level") }}', True),
+        ("{{ states.sensor.test.attributes.level }}", True),
+        ("{{ states.sensor.test.last_updated }}", True),
+        ("{{ states.sensor.test.name }}", True),
+        ('{{ states("sensor.test", with_unit=True) }}', True),
+    ],
+)
+async def test_render_to_info_has_attributes(
+    hass: HomeAssistant, template_str: str, has_attributes: bool
+) -> None:
+    """Test info records whether more than the state was read."""
+    hass.states.async_set("sensor.test", "on", {"level": 1})
+    info = render_to_info(hass, template_str)
+    assert info.has_attributes is has_attributes
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
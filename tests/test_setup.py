@@ -9,7 +9,7 @@ import voluptuous as vol
 
 from homeassistant import config_entries, setup
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import discovery
 from homeassistant.helpers.config_validation import (
@@ -732,6 +732,59 @@ async def test_async_start_setup_platforms(hass: HomeAssistant) -> None:
     assert "sensor" not in hass.data[setup.DATA_SETUP_TIME]
 
 
+async def test_async_start_setup_timeline(hass: HomeAssistant) -> None:
+    """Test setup started context manager keeps track of the startup timeline."""
+    hass.set_state(CoreState.starting)
+    with (
+        patch("homeassistant.setup.time.monotonic", side_effect=[1.0, 2.0]),
+        setup.async_start_setup(hass, ["august"]),
+    ):
+        pass
+    with (
+        patch("homeassistant.setup.time.monotonic", side_effect=[3.0, 5.0]),
+        setup.async_start_setup(hass, ["august.sensor"]),
+    ):
+        pass
+
+    assert hass.data[setup.DATA_SETUP_TIMELINE] == {"august": (1.0, 5.0)}
+
+    # Setups after startup, like reloads or during shutdown,
+    # do not change the timeline
+    for state in (CoreState.running, CoreState.stopping, CoreState.final_write):
+        hass.set_state(state)
+        with (
+            patch("homeassistant.setup.time.monotonic", side_effect=[10.0, 12.0]),
+            setup.async_start_setup(hass, ["august.light"]),
+        ):
+            pass
+
+    assert hass.data[setup.DATA_SETUP_TIMELINE] == {"august": (1.0, 5.0)}
+
+
+async def test_async_get_setup_critical_path(hass: HomeAssistant) -> None:
+    """Test the critical path follows the dependencies that finished last."""
+    assert setup.async_get_setup_critical_path(hass) == []
+
+    mock_integration(hass, MockModule("network"))
+    mock_integration(hass, MockModule("http"))
+    mock_integration(hass, MockModule("cloud", dependencies=["http"]))
+    mock_integration(
+        hass,
+        MockModule(
+            "alexa",
+            dependencies=["http"],
+            partial_manifest={"after_dependencies": ["cloud"]},
+        ),
+    )
+    hass.data[setup.DATA_SETUP_TIMELINE] = {
+        "network": (0.0, 1.0),
+        "http": (0.0, 2.0),
+        "cloud": (2.0, 9.0),
+        "alexa": (9.0, 10.0),
+    }
+    assert setup.async_get_setup_critical_path(hass) == ["http", "cloud", "alexa"]
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
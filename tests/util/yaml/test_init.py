@@ -719,3 +719,93 @@ def test_load_yaml_dict_fail(try_both_loaders, mock_hass_config_yaml: None) -> N
     """Test item without a key."""
     with pytest.raises(yaml_loader.YamlTypeError):
         yaml_loader.load_yaml_dict(YAML_CONFIG_FILE)
+
+
+def _write_settled(path: pathlib.Path, content: str, age: int = 60) -> None:
+    """Write a file with a modification time in the past."""
+    path.write_text(content)
+    mtime = path.stat().st_mtime - age
+    os.utime(path, (mtime, mtime))
+
+
+def test_yaml_file_cache(tmp_path: pathlib.Path) -> None:
+    """Test unchanged included files are reused."""
+    cache = yaml.YamlFileCache()
+    _write_settled(tmp_path / "configuration.yaml", "included: !include inc.yaml")
+    _write_settled(tmp_path / "inc.yaml", "key: [1, 2]")
+
+    with cache.activate():
+        first = yaml.load_yaml(tmp_path / "configuration.yaml")
+    assert first == {"included": {"key": [1, 2]}}
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    # Callers get their own copy
+    first["included"]["key"].append(3)
+    with cache.activate():
+        second = yaml.load_yaml(tmp_path / "configuration.yaml")
+    assert second == {"included": {"key": [1, 2]}}
+    assert second["included"].__config_file__ == str(tmp_path / "configuration.yaml")
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # A changed include invalidates the including file
+    _write_settled(tmp_path / "inc.yaml", "key: [3]", age=30)
+    with cache.activate():
+        assert yaml.load_yaml(tmp_path / "configuration.yaml") == {
+            "included": {"key": [3]}
+        }
+    assert (cache.hits, cache.misses) == (1, 4)
+
+    # Files changed very recently are not cached
+    (tmp_path / "inc.yaml").write_text("key: [4]")
+    with cache.activate():
+        yaml.load_yaml(tmp_path / "configuration.yaml")
+        yaml.load_yaml(tmp_path / "configuration.yaml")
+    assert (cache.hits, cache.misses) == (1, 8)
+
+    # The cache is only used while activated
+    yaml.load_yaml(tmp_path / "configuration.yaml")
+    assert (cache.hits, cache.misses) == (1, 8)
+
+
+def test_yaml_file_cache_include_dir(tmp_path: pathlib.Path) -> None:
+    """Test directory includes are invalidated when files are added."""
+    cache = yaml.YamlFileCache()
+    (tmp_path / "packages").mkdir()
+    _write_settled(tmp_path / "configuration.yaml", "p: !include_dir_named packages")
+    _write_settled(tmp_path / "packages" / "one.yaml", "a: 1")
+    os.utime(tmp_path / "packages", (0, 0))
+
+    with cache.activate():
+        yaml.load_yaml(tmp_path / "configuration.yaml")
+        assert yaml.load_yaml(tmp_path / "configuration.yaml") == {
+            "p": {"one": {"a": 1}}
+        }
+    assert cache.hits == 1
+
+    _write_settled(tmp_path / "packages" / "two.yaml", "b: 2")
+    os.utime(tmp_path / "packages", (1, 1))
+    with cache.activate():
+        assert yaml.load_yaml(tmp_path / "configuration.yaml") == {
+            "p": {"one": {"a": 1}, "two": {"b": 2}}
+        }
+    # Only the root was parsed again, one.yaml came from the cache
+    assert cache.hits == 2
+
+
+def test_yaml_file_cache_secrets(tmp_path: pathlib.Path) -> None:
+    """Test files using secrets are always parsed again."""
+    cache = yaml.YamlFileCache()
+    secrets = yaml.Secrets(tmp_path)
+    _write_settled(tmp_path / "configuration.yaml", "inc: !include inc.yaml")
+    _write_settled(tmp_path / "inc.yaml", "password: !secret pw")
+    _write_settled(tmp_path / "secrets.yaml", "pw: one")
+
+    with cache.activate():
+        yaml.load_yaml(tmp_path / "configuration.yaml", secrets)
+
+    _write_settled(tmp_path / "secrets.yaml", "pw: two", age=30)
+    with cache.activate():
+        assert yaml.load_yaml(
+            tmp_path / "configuration.yaml", yaml.Secrets(tmp_path)
+        ) == {"inc": {"password": "two"}}
+    assert cache.hits == 0